@@ -8,8 +8,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_DIRECTION, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_DIRECTION,
+    CONF_SCAN_INTERVAL,
+    DATA_SESSION,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
 from .coordinator import GdanskAirportCoordinator
+from .parser import create_session
 from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,15 +35,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         True if setup was successful
     """
     # Get configuration
-    direction = entry.data.get(CONF_DIRECTION)
-    scan_interval_minutes = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    data = entry.data
+    direction = data.get(CONF_DIRECTION)
+    scan_interval_minutes = data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     scan_interval = timedelta(minutes=scan_interval_minutes)
 
+    # Share one curl_cffi session (and its connection pool) across all entries
+    session = hass.data.get(DATA_SESSION)
+    if session is None:
+        session = hass.data[DATA_SESSION] = create_session()
+
     # Create coordinator
     coordinator = GdanskAirportCoordinator(
         hass,
         direction=direction,
         scan_interval=scan_interval,
+        session=session,
     )
 
     # Update options if available
@@ -47,13 +61,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
+    domain_data = hass.data.get(DOMAIN)
+    first_entry = not domain_data
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    domain_data[entry.entry_id] = {
         "coordinator": coordinator,
     }
 
     # Set up services (only once for all instances)
-    if len(hass.data[DOMAIN]) == 1:
+    if first_entry:
         await async_setup_services(hass)
 
     # Set up platforms
@@ -92,15 +109,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove coordinator and cleanup
     if unload_ok:
-        coordinator: GdanskAirportCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-
-        # Close curl_cffi session
-        await coordinator.session.close()
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
 
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Stop the update in flight before the session it uses can be closed
+        await entry_data["coordinator"].async_shutdown()
 
-        # Unload services when last instance is removed
+        # Unload services and close the shared session when last instance is removed
         if not hass.data[DOMAIN]:
             await async_unload_services(hass)
 
+            session = hass.data.pop(DATA_SESSION, None)
+            if session is not None:
+                await session.close()
+
     return unload_ok
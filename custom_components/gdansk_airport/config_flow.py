@@ -1,9 +1,8 @@
 """Config flow for Gdańsk Airport integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Any
+from typing import Any, Final
 
 import voluptuous as vol
 from curl_cffi.requests import AsyncSession
@@ -26,6 +25,7 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_TIME_WINDOW,
     CONF_TRACKED_FLIGHTS,
+    DATA_SESSION,
     DEFAULT_HIDE_CANCELLED,
     DEFAULT_HIDE_LANDED,
     DEFAULT_MAX_FLIGHTS,
@@ -43,10 +43,60 @@ from .const import (
     MIN_TIME_WINDOW,
     URL_ARRIVALS,
 )
-from .parser import fetch_flights
+from .parser import create_session, fetch_flights
 
 _LOGGER = logging.getLogger(__name__)
 
+# (connect, read) timeout in seconds for the connection check
+VALIDATE_TIMEOUT: Final = (10.0, 30.0)
+
+# Schemas are built once at import instead of on every form render
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NAME, default="Gdańsk Airport"): str,
+        vol.Required(CONF_DIRECTION, default=DIRECTION_BOTH): vol.In(
+            {
+                DIRECTION_ARRIVALS: "Arrivals",
+                DIRECTION_DEPARTURES: "Departures",
+                DIRECTION_BOTH: "Both",
+            }
+        ),
+        vol.Optional(
+            CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
+        ): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+        ),
+    }
+)
+
+# Options flow validators with their fallback defaults; only the outer schema
+# is rebuilt per render because defaults come from the current options
+_OPTIONS_VALIDATORS: dict[str, tuple[Any, Any]] = {
+    CONF_MAX_FLIGHTS: (
+        DEFAULT_MAX_FLIGHTS,
+        vol.All(
+            vol.Coerce(int),
+            vol.Range(min=MIN_MAX_FLIGHTS, max=MAX_MAX_FLIGHTS),
+        ),
+    ),
+    CONF_TIME_WINDOW: (
+        DEFAULT_TIME_WINDOW,
+        vol.All(
+            vol.Coerce(int),
+            vol.Range(min=MIN_TIME_WINDOW, max=MAX_TIME_WINDOW),
+        ),
+    ),
+    CONF_HIDE_LANDED: (DEFAULT_HIDE_LANDED, bool),
+    CONF_HIDE_CANCELLED: (DEFAULT_HIDE_CANCELLED, bool),
+    CONF_AIRLINES_FILTER: ("", str),
+    CONF_DESTINATIONS_FILTER: ("", str),
+    # Events configuration (v2)
+    CONF_EVENTS_ENABLED: (False, bool),
+    CONF_EVENTS_ALL_FLIGHTS: (False, bool),
+    CONF_TRACKED_FLIGHTS: ("", str),
+}
+
 
 async def validate_connection(hass: HomeAssistant) -> bool:
     """Validate that we can connect to the airport website.
@@ -60,34 +110,34 @@ async def validate_connection(hass: HomeAssistant) -> bool:
     Raises:
         Exception: On connection error or timeout
     """
-    async with AsyncSession(
-        impersonate="chrome120",
-        verify=True,
-        timeout=30,
-        allow_redirects=True,
-        max_redirects=5,
-    ) as session:
-        try:
-            # Try to fetch arrivals page
-            _LOGGER.debug("Validating connection to airport website: %s", URL_ARRIVALS)
-            await fetch_flights(session, DIRECTION_ARRIVALS)
-            _LOGGER.debug("Connection validation successful")
-            return True
-        except CurlTimeout as err:
-            _LOGGER.error(
-                "Timeout connecting to airport website %s: %s",
-                URL_ARRIVALS,
-                type(err).__name__,
-            )
-            raise
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to connect to airport website %s: %s - %s",
-                URL_ARRIVALS,
-                type(err).__name__,
-                str(err) or "No error message available",
-            )
-            raise
+    # Reuse the integration's session when another entry is already loaded
+    shared_session: AsyncSession | None = hass.data.get(DATA_SESSION)
+    session = shared_session or create_session()
+
+    try:
+        # Try to fetch arrivals page
+        _LOGGER.debug("Validating connection to airport website: %s", URL_ARRIVALS)
+        await fetch_flights(session, DIRECTION_ARRIVALS, timeout=VALIDATE_TIMEOUT)
+        _LOGGER.debug("Connection validation successful")
+        return True
+    except (CurlTimeout, TimeoutError) as err:
+        _LOGGER.error(
+            "Timeout connecting to airport website %s: %s",
+            URL_ARRIVALS,
+            type(err).__name__,
+        )
+        raise
+    except Exception as err:
+        _LOGGER.error(
+            "Failed to connect to airport website %s: %s - %s",
+            URL_ARRIVALS,
+            type(err).__name__,
+            str(err) or "No error message available",
+        )
+        raise
+    finally:
+        if shared_session is None:
+            await session.close()
 
 
 class GdanskAirportConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -112,7 +162,13 @@ class GdanskAirportConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 # Validate connection
                 await validate_connection(self.hass)
-
+            except (CurlTimeout, TimeoutError):
+                _LOGGER.warning("Timeout connecting to airport website during setup")
+                errors["base"] = "timeout_connect"
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Error connecting to airport website: %s", type(err).__name__)
+                errors["base"] = "cannot_connect"
+            else:
                 # Create unique ID based on direction
                 await self.async_set_unique_id(
                     f"gdansk_airport_{user_input[CONF_DIRECTION]}"
@@ -125,36 +181,9 @@ class GdanskAirportConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-            except CurlTimeout:
-                _LOGGER.warning("Timeout connecting to airport website during setup")
-                errors["base"] = "timeout_connect"
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning("Error connecting to airport website: %s", type(err).__name__)
-                errors["base"] = "cannot_connect"
-
-        # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Optional(CONF_NAME, default="Gdańsk Airport"): str,
-                vol.Required(CONF_DIRECTION, default=DIRECTION_BOTH): vol.In(
-                    {
-                        DIRECTION_ARRIVALS: "Arrivals",
-                        DIRECTION_DEPARTURES: "Departures",
-                        DIRECTION_BOTH: "Both",
-                    }
-                ),
-                vol.Optional(
-                    CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -204,49 +233,8 @@ class GdanskAirportOptionsFlow(config_entries.OptionsFlow):
 
         data_schema = vol.Schema(
             {
-                vol.Optional(
-                    CONF_MAX_FLIGHTS,
-                    default=options.get(CONF_MAX_FLIGHTS, DEFAULT_MAX_FLIGHTS),
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=MIN_MAX_FLIGHTS, max=MAX_MAX_FLIGHTS),
-                ),
-                vol.Optional(
-                    CONF_TIME_WINDOW,
-                    default=options.get(CONF_TIME_WINDOW, DEFAULT_TIME_WINDOW),
-                ): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=MIN_TIME_WINDOW, max=MAX_TIME_WINDOW),
-                ),
-                vol.Optional(
-                    CONF_HIDE_LANDED,
-                    default=options.get(CONF_HIDE_LANDED, DEFAULT_HIDE_LANDED),
-                ): bool,
-                vol.Optional(
-                    CONF_HIDE_CANCELLED,
-                    default=options.get(CONF_HIDE_CANCELLED, DEFAULT_HIDE_CANCELLED),
-                ): bool,
-                vol.Optional(
-                    CONF_AIRLINES_FILTER,
-                    default=options.get(CONF_AIRLINES_FILTER, ""),
-                ): str,
-                vol.Optional(
-                    CONF_DESTINATIONS_FILTER,
-                    default=options.get(CONF_DESTINATIONS_FILTER, ""),
-                ): str,
-                # Events configuration (v2)
-                vol.Optional(
-                    CONF_EVENTS_ENABLED,
-                    default=options.get(CONF_EVENTS_ENABLED, False),
-                ): bool,
-                vol.Optional(
-                    CONF_EVENTS_ALL_FLIGHTS,
-                    default=options.get(CONF_EVENTS_ALL_FLIGHTS, False),
-                ): bool,
-                vol.Optional(
-                    CONF_TRACKED_FLIGHTS,
-                    default=options.get(CONF_TRACKED_FLIGHTS, ""),
-                ): str,
+                vol.Optional(key, default=options.get(key, default)): validator
+                for key, (default, validator) in _OPTIONS_VALIDATORS.items()
             }
         )
 
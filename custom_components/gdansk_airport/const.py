@@ -1,9 +1,14 @@
 """Constants for Gdańsk Airport integration."""
 from enum import StrEnum
+from functools import lru_cache
 from typing import Final
+import unicodedata
 
 DOMAIN: Final = "gdansk_airport"
 
+# hass.data key for the HTTP session shared by all config entries
+DATA_SESSION: Final = f"{DOMAIN}_session"
+
 # Configuration keys
 CONF_DIRECTION: Final = "direction"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
@@ -39,6 +44,17 @@ DIRECTION_BOTH: Final = "both"
 # URLs
 URL_ARRIVALS: Final = "https://www.airport.gdansk.pl/loty/tablica-przylotow-p1.html"
 URL_DEPARTURES: Final = "https://www.airport.gdansk.pl/loty/tablica-odlotow-p2.html"
+URL_BY_DIRECTION: Final[dict[str, str]] = {
+    DIRECTION_ARRIVALS: URL_ARRIVALS,
+    DIRECTION_DEPARTURES: URL_DEPARTURES,
+}
+
+# Boards to fetch for each configured direction
+DIRECTIONS_BY_CONFIG: Final[dict[str, tuple[str, ...]]] = {
+    DIRECTION_ARRIVALS: (DIRECTION_ARRIVALS,),
+    DIRECTION_DEPARTURES: (DIRECTION_DEPARTURES,),
+    DIRECTION_BOTH: (DIRECTION_ARRIVALS, DIRECTION_DEPARTURES),
+}
 
 # User agent
 USER_AGENT: Final = (
@@ -54,6 +70,7 @@ DEFAULT_TIME_WINDOW: Final = 24  # hours
 DEFAULT_HIDE_LANDED: Final = False
 DEFAULT_HIDE_CANCELLED: Final = True
 DEFAULT_MAX_CACHE_AGE_HOURS: Final = 1  # Maximum age for cached data (flight data changes frequently)
+MAX_BACKOFF_INTERVAL_MINUTES: Final = 30  # Longest update interval while rate limited
 
 # Limits
 MIN_SCAN_INTERVAL: Final = 2
@@ -111,6 +128,51 @@ STATUS_MAPPING_PL: Final[dict[str, FlightStatus]] = {
 }
 
 
+def _build_prefix_buckets(
+    mapping: dict[str, FlightStatus],
+) -> dict[str, tuple[tuple[str, FlightStatus], ...]]:
+    """Group status mapping entries by the first two characters of their key.
+
+    Entries within a bucket are ordered longest key first, so the most
+    specific prefix wins (e.g., "ODPRAWA OD" is tried before "ODPRAWA").
+
+    Args:
+        mapping: Status text to FlightStatus mapping
+
+    Returns:
+        Dictionary of two-character prefix to (key, status) pairs
+    """
+    buckets: dict[str, list[tuple[str, FlightStatus]]] = {}
+    for key, status in sorted(mapping.items(), key=lambda item: -len(item[0])):
+        buckets.setdefault(key[:2], []).append((key, status))
+    return {prefix: tuple(entries) for prefix, entries in buckets.items()}
+
+
+def _fold(text: str) -> str:
+    """Fold text to uppercase ASCII by stripping Polish diacritics.
+
+    Args:
+        text: Text to fold (e.g., "Wylądował")
+
+    Returns:
+        Folded text (e.g., "WYLADOWAL")
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    # "Ł" has no decomposition, so it has to be replaced explicitly
+    return stripped.upper().replace("Ł", "L")
+
+
+# Status mapping keyed by folded text, so diacritic and ASCII spellings share one entry
+_STATUS_ASCII: Final[dict[str, FlightStatus]] = {
+    _fold(key): status for key, status in STATUS_MAPPING_PL.items()
+}
+
+# Prefix lookup for statuses with additional info, so partial matching only
+# compares against the handful of keys sharing the same leading characters
+_PREFIX_BY_FIRST2: Final = _build_prefix_buckets(_STATUS_ASCII)
+
+
 def parse_status(status_text: str) -> FlightStatus:
     """Parse status text to FlightStatus enum.
 
@@ -123,15 +185,31 @@ def parse_status(status_text: str) -> FlightStatus:
     if not status_text:
         return FlightStatus.UNKNOWN
 
-    # Normalize: uppercase and strip whitespace
-    normalized = status_text.strip().upper()
+    return _parse_status_cached(status_text)
+
+
+@lru_cache(maxsize=512)
+def _parse_status_cached(status_text: str) -> FlightStatus:
+    """Resolve non-empty status text to FlightStatus enum.
+
+    Status texts repeat heavily across rows and refreshes, so results are memoized.
+
+    Args:
+        status_text: Raw, non-empty status text from website
+
+    Returns:
+        FlightStatus enum value
+    """
+    # Normalize: strip whitespace, uppercase and fold diacritics
+    normalized = _fold(status_text.strip())
 
-    # Try exact match first
-    if normalized in STATUS_MAPPING_PL:
-        return STATUS_MAPPING_PL[normalized]
+    # Try exact match first (single lookup; misses fall through to prefix matching)
+    status = _STATUS_ASCII.get(normalized)
+    if status is not None:
+        return status
 
     # Try partial matches for statuses with additional info (e.g., "OPÓŹNIONY 00:32")
-    for key, status in STATUS_MAPPING_PL.items():
+    for key, status in _PREFIX_BY_FIRST2.get(normalized[:2], ()):
         if normalized.startswith(key):
             return status
 
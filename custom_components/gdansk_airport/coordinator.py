@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, timedelta
+import heapq
+from itertools import chain
 import logging
+from operator import attrgetter
+import time
 from typing import Any
 
 from curl_cffi.requests import AsyncSession
-from curl_cffi.requests.exceptions import Timeout as CurlTimeout
+from curl_cffi.requests.exceptions import HTTPError, Timeout as CurlTimeout
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -28,8 +33,8 @@ from .const import (
     DEFAULT_MAX_FLIGHTS,
     DEFAULT_TIME_WINDOW,
     DIRECTION_ARRIVALS,
-    DIRECTION_BOTH,
     DIRECTION_DEPARTURES,
+    DIRECTIONS_BY_CONFIG,
     DOMAIN,
     EVENT_FLIGHT_BOARDING,
     EVENT_FLIGHT_CANCELLED,
@@ -39,13 +44,46 @@ from .const import (
     EVENT_FLIGHT_GATE_CLOSED,
     EVENT_FLIGHT_LANDED,
     EVENT_FLIGHT_STATUS_CHANGED,
+    MAX_BACKOFF_INTERVAL_MINUTES,
     FlightStatus,
 )
-from .parser import Flight, fetch_all_flights
+from .parser import BoardCache, Flight, fetch_all_flights, retry_after_seconds
 from .state_tracker import FlightStateTracker
 
 _LOGGER = logging.getLogger(__name__)
 
+# Statuses of flights that have already arrived or left
+_COMPLETED_STATUSES = frozenset({FlightStatus.LANDED, FlightStatus.DEPARTED})
+# Statuses of flights that will not arrive or leave anymore
+_FINISHED_STATUSES = _COMPLETED_STATUSES | {FlightStatus.CANCELLED}
+
+# Sort key for flights in board order
+_BY_SCHEDULED_TIME = attrgetter("scheduled_time")
+
+# Specific event fired when a flight enters a status
+_STATUS_EVENT_MAP = {
+    FlightStatus.LANDED: EVENT_FLIGHT_LANDED,
+    FlightStatus.DEPARTED: EVENT_FLIGHT_DEPARTED,
+    FlightStatus.DELAYED: EVENT_FLIGHT_DELAYED,
+    FlightStatus.CANCELLED: EVENT_FLIGHT_CANCELLED,
+    FlightStatus.BOARDING: EVENT_FLIGHT_BOARDING,
+    FlightStatus.GATE_CLOSED: EVENT_FLIGHT_GATE_CLOSED,
+    FlightStatus.FINAL_CALL: EVENT_FLIGHT_FINAL_CALL,
+}
+
+
+def _parse_csv(raw: str, normalize: Callable[[str], str]) -> Iterator[str]:
+    """Split a comma-separated option value into normalized tokens.
+
+    Args:
+        raw: Comma-separated string from the options
+        normalize: Case conversion applied to each stripped token
+
+    Returns:
+        Iterator over non-empty tokens
+    """
+    return (token for part in raw.split(",") if (token := normalize(part.strip())))
+
 
 class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage fetching Gdańsk Airport data."""
@@ -55,6 +93,7 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         direction: str,
         scan_interval: timedelta,
+        session: AsyncSession,
     ) -> None:
         """Initialize coordinator.
 
@@ -62,6 +101,7 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass: Home Assistant instance
             direction: Flight direction (arrivals, departures, both)
             scan_interval: Update interval
+            session: Shared curl_cffi session (owned by the integration)
         """
         super().__init__(
             hass,
@@ -70,19 +110,30 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=scan_interval,
         )
         self.direction = direction
-        # Use Chrome impersonation to better bypass bot detection
-        # Additional options for better connectivity
-        self.session: AsyncSession = AsyncSession(
-            impersonate="chrome120",
-            verify=True,  # Verify SSL certificates
-            timeout=30,  # Default timeout for all requests
-            allow_redirects=True,  # Follow redirects
-            max_redirects=5,  # Limit redirect chains
-        )
+        self.session = session
+
+        # Resolve which boards to fetch once instead of on every update
+        directions = DIRECTIONS_BY_CONFIG.get(direction, ())
+        self._fetch_arrivals = DIRECTION_ARRIVALS in directions
+        self._fetch_departures = DIRECTION_DEPARTURES in directions
+
+        # Update currently in flight, shared by concurrent refreshes
+        self._update_task: asyncio.Task[dict[str, Any]] | None = None
 
         # Cache management
-        self._last_successful_update: datetime | None = None
+        self._last_successful_update: datetime | None = None  # shown to users
+        self._last_update_monotonic: float | None = None  # used for cache age
         self._max_cache_age = timedelta(hours=DEFAULT_MAX_CACHE_AGE_HOURS)
+        self._last_result: dict[str, list[Flight]] | None = None
+        self._soft_ttl = scan_interval.total_seconds() / 2
+        self._scan_interval = scan_interval
+        self._max_backoff_interval = max(
+            timedelta(minutes=MAX_BACKOFF_INTERVAL_MINUTES), scan_interval
+        )
+        self._board_caches = {
+            DIRECTION_ARRIVALS: BoardCache(),
+            DIRECTION_DEPARTURES: BoardCache(),
+        }
 
         # State tracking for events (v2)
         self._state_tracker = FlightStateTracker()
@@ -95,8 +146,8 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.time_window_hours: int = DEFAULT_TIME_WINDOW
         self.hide_landed: bool = DEFAULT_HIDE_LANDED
         self.hide_cancelled: bool = DEFAULT_HIDE_CANCELLED
-        self.airlines_filter: list[str] = []
-        self.destinations_filter: list[str] = []
+        self.airlines_filter: frozenset[str] = frozenset()
+        self.destinations_filter: tuple[str, ...] = ()
 
     def update_options(self, options: dict[str, Any]) -> None:
         """Update coordinator options.
@@ -111,14 +162,10 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Parse filter strings
         airlines = options.get(CONF_AIRLINES_FILTER, "")
-        self.airlines_filter = [
-            a.strip().upper() for a in airlines.split(",") if a.strip()
-        ]
+        self.airlines_filter = frozenset(_parse_csv(airlines, str.upper))
 
         destinations = options.get(CONF_DESTINATIONS_FILTER, "")
-        self.destinations_filter = [
-            d.strip().lower() for d in destinations.split(",") if d.strip()
-        ]
+        self.destinations_filter = tuple(_parse_csv(destinations, str.lower))
 
         # Events configuration (v2)
         self._events_enabled = options.get(CONF_EVENTS_ENABLED, False)
@@ -126,25 +173,37 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Parse tracked flights
         tracked = options.get(CONF_TRACKED_FLIGHTS, "")
-        self._tracked_flights = {
-            f.strip().upper() for f in tracked.split(",") if f.strip()
-        }
+        self._tracked_flights = set(_parse_csv(tracked, str.upper))
 
-    def add_tracked_flight(self, flight_number: str) -> None:
+    def add_tracked_flight(self, flight_number: str) -> bool:
         """Add a flight to tracking list.
 
         Args:
             flight_number: Flight number to track (will be normalized to uppercase)
+
+        Returns:
+            True if the flight was not tracked before
         """
-        self._tracked_flights.add(flight_number.upper())
+        flight_number = flight_number.upper()
+        if flight_number in self._tracked_flights:
+            return False
+        self._tracked_flights.add(flight_number)
+        return True
 
-    def remove_tracked_flight(self, flight_number: str) -> None:
+    def remove_tracked_flight(self, flight_number: str) -> bool:
         """Remove a flight from tracking list.
 
         Args:
             flight_number: Flight number to stop tracking (will be normalized to uppercase)
+
+        Returns:
+            True if the flight was tracked before
         """
-        self._tracked_flights.discard(flight_number.upper())
+        flight_number = flight_number.upper()
+        if flight_number not in self._tracked_flights:
+            return False
+        self._tracked_flights.remove(flight_number)
+        return True
 
     def get_tracked_flights(self) -> set[str]:
         """Get copy of tracked flights set.
@@ -163,56 +222,59 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Filtered list of flights
         """
-        filtered = []
-
-        for flight in flights:
+        # Loop-invariant filter settings
+        now = datetime.now()
+        now_min = now.hour * 60 + now.minute
+        window_min = self.time_window_hours * 60
+
+        hidden_statuses: frozenset[FlightStatus] = frozenset()
+        if self.hide_landed:
+            hidden_statuses = _COMPLETED_STATUSES
+        if self.hide_cancelled:
+            hidden_statuses |= {FlightStatus.CANCELLED}
+
+        airlines = self.airlines_filter
+        destinations = self.destinations_filter
+
+        def passes(flight: Flight) -> bool:
+            """Check whether a flight passes all configured filters."""
             # Filter by status
-            if self.hide_landed and flight.status in (
-                FlightStatus.LANDED,
-                FlightStatus.DEPARTED,
-            ):
-                continue
-
-            if self.hide_cancelled and flight.status == FlightStatus.CANCELLED:
-                continue
+            if flight.status in hidden_statuses:
+                return False
 
             # Filter by airline
-            if self.airlines_filter and flight.airline.upper() not in self.airlines_filter:
-                continue
+            if airlines and flight.airline_upper not in airlines:
+                return False
 
             # Filter by destination/origin
-            if self.destinations_filter:
-                location = (flight.destination or flight.origin or "").lower()
-                if not any(dest in location for dest in self.destinations_filter):
-                    continue
+            if destinations and not any(
+                dest in flight.location_lower for dest in destinations
+            ):
+                return False
 
             # Filter by time window
-            try:
-                scheduled_h, scheduled_m = map(int, flight.scheduled_time.split(":"))
-                flight_time = datetime.now().replace(
-                    hour=scheduled_h, minute=scheduled_m, second=0, microsecond=0
+            if flight.sched_min is None:
+                _LOGGER.debug(
+                    "Could not filter by time for flight %s: %s",
+                    flight.flight_number,
+                    flight.scheduled_time,
                 )
-                now = datetime.now()
-
-                # Handle flights scheduled for next day
-                if flight_time < now - timedelta(hours=12):
-                    flight_time += timedelta(days=1)
+                return True
 
-                time_diff = abs((flight_time - now).total_seconds() / 3600)
+            diff_min = flight.sched_min - now_min
 
-                if time_diff > self.time_window_hours:
-                    continue
+            # Handle flights scheduled for next day
+            if diff_min < -720:
+                diff_min += 1440
 
-            except (ValueError, AttributeError) as err:
-                _LOGGER.debug("Could not filter by time for flight %s: %s", flight.flight_number, err)
+            return abs(diff_min) <= window_min
 
-            filtered.append(flight)
-
-        # Sort by scheduled time
-        filtered.sort(key=lambda f: f.scheduled_time)
-
-        # Limit to max_flights
-        return filtered[: self.max_flights]
+        # Keep the max_flights earliest by scheduled time without sorting everything
+        return heapq.nsmallest(
+            self.max_flights,
+            filter(passes, flights),
+            key=_BY_SCHEDULED_TIME,
+        )
 
     def _get_next_flight(self, flights: list[Flight]) -> Flight | None:
         """Get next upcoming flight.
@@ -223,24 +285,12 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Next flight or None
         """
-        if not flights:
-            return None
-
-        # Filter out already landed/departed flights
-        upcoming = [
-            f
-            for f in flights
-            if f.status
-            not in (FlightStatus.LANDED, FlightStatus.DEPARTED, FlightStatus.CANCELLED)
-        ]
-
-        if not upcoming:
-            return None
-
-        # Sort by expected or scheduled time
-        upcoming.sort(key=lambda f: f.expected_time or f.scheduled_time)
-
-        return upcoming[0]
+        # Earliest by expected or scheduled time, skipping landed/departed flights
+        return min(
+            (f for f in flights if f.status not in _FINISHED_STATUSES),
+            key=lambda f: f.expected_time or f.scheduled_time,
+            default=None,
+        )
 
     def _is_cache_valid(self) -> bool:
         """Check if cached data is still valid.
@@ -248,10 +298,11 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             True if cache is valid and not too old
         """
-        if not self.data or not self._last_successful_update:
+        cache_age_seconds = self._cache_age_seconds()
+        if not self.data or cache_age_seconds is None:
             return False
 
-        cache_age = datetime.now() - self._last_successful_update
+        cache_age = timedelta(seconds=cache_age_seconds)
         is_valid = cache_age < self._max_cache_age
 
         if not is_valid:
@@ -263,70 +314,172 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return is_valid
 
+    def _cache_age_seconds(self) -> float | None:
+        """Get time since the last successful fetch.
+
+        Measured on the monotonic clock so wall-clock jumps (DST, NTP) do not
+        skew it.
+
+        Returns:
+            Age in seconds, or None if nothing has been fetched yet
+        """
+        if self._last_update_monotonic is None:
+            return None
+        return time.monotonic() - self._last_update_monotonic
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API.
 
+        Concurrent calls (e.g., a scheduled refresh overlapping an options reload)
+        share the update already in flight instead of fetching the boards twice.
+
         Returns:
             Dictionary with flight data
 
         Raises:
             UpdateFailed: On error
         """
-        try:
-            # Determine what to fetch
-            fetch_arrivals = self.direction in (DIRECTION_ARRIVALS, DIRECTION_BOTH)
-            fetch_departures = self.direction in (DIRECTION_DEPARTURES, DIRECTION_BOTH)
+        task = self._update_task
+        if task is None or task.done():
+            task = self._update_task = self.hass.async_create_background_task(
+                self._async_fetch_data(), name=f"{DOMAIN} update"
+            )
+
+        return await asyncio.shield(task)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the update in flight and stop scheduled refreshes."""
+        await super().async_shutdown()
+        if self._update_task is not None:
+            self._update_task.cancel()
 
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch, filter and package flight data.
+
+        Returns:
+            Dictionary with flight data
+
+        Raises:
+            UpdateFailed: On error
+        """
+        # Refreshes shortly after a successful fetch (e.g., options reloads) only
+        # re-apply the filters to the boards already fetched
+        cache_age_seconds = self._cache_age_seconds()
+        if (
+            self._last_result is not None
+            and cache_age_seconds is not None
+            and cache_age_seconds < self._soft_ttl
+        ):
+            return self._build_data(self._last_result, cache_age_seconds)
+
+        try:
             # Fetch data
             result = await fetch_all_flights(
                 self.session,
-                fetch_arrivals=fetch_arrivals,
-                fetch_departures=fetch_departures,
+                fetch_arrivals=self._fetch_arrivals,
+                fetch_departures=self._fetch_departures,
+                caches=self._board_caches,
             )
 
             # Process state changes for events (before filtering)
-            all_flights = (
-                result.get(DIRECTION_ARRIVALS, []) + result.get(DIRECTION_DEPARTURES, [])
+            all_flights = chain(
+                result.get(DIRECTION_ARRIVALS, ()), result.get(DIRECTION_DEPARTURES, ())
             )
             self._process_state_changes(all_flights)
 
-            # Filter flights
-            arrivals = self._filter_flights(result.get(DIRECTION_ARRIVALS, []))
-            departures = self._filter_flights(result.get(DIRECTION_DEPARTURES, []))
-
-            # Get next flights
-            next_arrival = self._get_next_flight(arrivals) if arrivals else None
-            next_departure = self._get_next_flight(departures) if departures else None
-
-            # Update timestamp
-            now = datetime.now()
-            self._last_successful_update = now
-
-            data = {
-                DIRECTION_ARRIVALS: arrivals,
-                DIRECTION_DEPARTURES: departures,
-                "next_arrival": next_arrival,
-                "next_departure": next_departure,
-                "last_updated": now.isoformat(),
-                "data_source": "live",
-                "cache_age_seconds": 0,
-            }
-
-            _LOGGER.debug(
-                "Updated data: %d arrivals, %d departures",
-                len(arrivals),
-                len(departures),
-            )
+            # Back to the configured interval after backing off
+            if self.update_interval != self._scan_interval:
+                _LOGGER.info(
+                    "Airport website responding again, resuming updates every %s",
+                    self._scan_interval,
+                )
+                self.update_interval = self._scan_interval
+
+            # Update timestamps
+            self._last_successful_update = datetime.now()
+            self._last_update_monotonic = time.monotonic()
+            self._last_result = result
 
-            return data
+            return self._build_data(result)
 
         except CurlTimeout as err:
             return self._handle_update_error("Timeout", err)
 
+        except HTTPError as err:
+            # Only rate limiting reaches here; other HTTP errors are per-board
+            self._back_off(retry_after_seconds(err.response))
+            return self._handle_update_error("Rate limited", err)
+
         except Exception as err:
             _LOGGER.exception("Unexpected error fetching data: %s", err)
             return self._handle_update_error("Unexpected error", err)
 
+    def _back_off(self, retry_after: float | None) -> None:
+        """Lengthen the update interval after the website asked us to slow down.
+
+        Doubles the current interval, or waits as long as the website asked if
+        that is longer, up to the maximum backoff interval.
+
+        Args:
+            retry_after: Seconds requested by the Retry-After header, if any
+        """
+        interval = max(
+            2 * self.update_interval,
+            timedelta(seconds=retry_after or 0),
+        )
+        self.update_interval = min(interval, self._max_backoff_interval)
+
+        _LOGGER.warning(
+            "Airport website is rate limiting requests, next update in %s",
+            self.update_interval,
+        )
+
+    def _build_data(
+        self,
+        result: dict[str, list[Flight]],
+        cache_age_seconds: float | None = None,
+    ) -> dict[str, Any]:
+        """Filter fetched boards and package them as coordinator data.
+
+        Args:
+            result: Unfiltered flights keyed by direction
+            cache_age_seconds: Age of the boards when reused from an earlier
+                fetch, None when they were just fetched
+
+        Returns:
+            Dictionary with flight data
+        """
+        # Filter flights
+        arrivals = self._filter_flights(result.get(DIRECTION_ARRIVALS, []))
+        departures = self._filter_flights(result.get(DIRECTION_DEPARTURES, []))
+
+        # Get next flights
+        next_arrival = self._get_next_flight(arrivals) if arrivals else None
+        next_departure = self._get_next_flight(departures) if departures else None
+
+        data = {
+            DIRECTION_ARRIVALS: arrivals,
+            DIRECTION_DEPARTURES: departures,
+            "next_arrival": next_arrival,
+            "next_departure": next_departure,
+            "last_updated": self._last_successful_update.isoformat(),
+            "data_source": "live",
+            "cache_age_seconds": 0,
+        }
+
+        if cache_age_seconds is not None:
+            data["data_source"] = "cache"
+            data["cache_age_seconds"] = int(cache_age_seconds)
+            data["cache_age_minutes"] = int(cache_age_seconds) // 60
+
+        _LOGGER.debug(
+            "Updated data: %d arrivals, %d departures",
+            len(arrivals),
+            len(departures),
+        )
+
+        return data
+
     def _handle_update_error(self, error_type: str, error: Exception) -> dict[str, Any]:
         """Handle update errors with cache fallback.
 
@@ -342,8 +495,8 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         # Check if we have valid cached data
         if self._is_cache_valid():
-            cache_age = datetime.now() - self._last_successful_update
-            cache_age_seconds = int(cache_age.total_seconds())
+            cache_age_seconds = int(self._cache_age_seconds())
+            cache_age = timedelta(seconds=cache_age_seconds)
 
             _LOGGER.warning(
                 "%s: %s - Using cached data (age: %s)",
@@ -373,16 +526,7 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Event type string or None if no specific event
         """
-        status_event_map = {
-            FlightStatus.LANDED: EVENT_FLIGHT_LANDED,
-            FlightStatus.DEPARTED: EVENT_FLIGHT_DEPARTED,
-            FlightStatus.DELAYED: EVENT_FLIGHT_DELAYED,
-            FlightStatus.CANCELLED: EVENT_FLIGHT_CANCELLED,
-            FlightStatus.BOARDING: EVENT_FLIGHT_BOARDING,
-            FlightStatus.GATE_CLOSED: EVENT_FLIGHT_GATE_CLOSED,
-            FlightStatus.FINAL_CALL: EVENT_FLIGHT_FINAL_CALL,
-        }
-        return status_event_map.get(new_status)
+        return _STATUS_EVENT_MAP.get(new_status)
 
     def _should_fire_event(self, flight: Flight) -> bool:
         """Check if event should be fired for this flight.
@@ -401,7 +545,7 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return True
 
         # Fire only for tracked flights
-        return flight.flight_number.upper() in self._tracked_flights
+        return flight.flight_number_upper in self._tracked_flights
 
     def _fire_event(self, event_type: str, flight: Flight, old_status: FlightStatus | None = None) -> None:
         """Fire a flight event to Home Assistant.
@@ -431,7 +575,9 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if old_status:
             event_data["old_status"] = old_status.value
 
-        self.hass.bus.fire(event_type, event_data)
+        # Updates run in the event loop, so fire directly instead of via the
+        # thread-safe fire(), which schedules one loop callback per event
+        self.hass.bus.async_fire(event_type, event_data)
 
         _LOGGER.debug(
             "Fired event %s for flight %s (status: %s)",
@@ -440,11 +586,11 @@ class GdanskAirportCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             flight.status.value,
         )
 
-    def _process_state_changes(self, all_flights: list[Flight]) -> None:
+    def _process_state_changes(self, all_flights: Iterable[Flight]) -> None:
         """Process state changes and fire events.
 
         Args:
-            all_flights: List of all current flights (before filtering)
+            all_flights: All current flights (before filtering)
         """
         if not self._events_enabled:
             return
@@ -6,19 +6,20 @@ import html
 import json
 import logging
 import re
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from curl_cffi import CurlOpt
 from curl_cffi.requests import AsyncSession
-from curl_cffi.requests.exceptions import Timeout as CurlTimeout
+from curl_cffi.requests.exceptions import HTTPError, Timeout as CurlTimeout
 
 from .const import (
     DIRECTION_ARRIVALS,
     DIRECTION_DEPARTURES,
-    URL_ARRIVALS,
-    URL_DEPARTURES,
+    URL_BY_DIRECTION,
     USER_AGENT,
     FlightStatus,
     parse_status,
@@ -29,12 +30,52 @@ _LOGGER = logging.getLogger(__name__)
 # Timeout for HTTP requests
 REQUEST_TIMEOUT = 30
 
+# Pooled connections idle for longer than this are not reused (seconds).
+# Kept below the web server's keep-alive timeout so the first scan after an
+# idle period opens a fresh connection instead of hitting a reset socket.
+CONNECTION_MAX_IDLE = 55
+
+# Symfony UX React component embedding the flight data as JSON props
+REACT_CONTROLLER = "symfony--ux-react--react"
+REACT_PROPS_ATTR = "data-symfony--ux-react--react-props-value"
+
+# Only the React container is needed when extracting the JSON props
+_REACT_CONTAINER = SoupStrainer("div", attrs={"data-controller": REACT_CONTROLLER})
+
+# HH:MM time embedded in status text, e.g. "OPÓŹNIONY 00:32"
+TIME_PATTERN = re.compile(r"\b(\d{1,2}:\d{2})\b")
+
 # Retry configuration
 MAX_RETRIES = 2
 RETRY_DELAY = 3  # Initial retry delay in seconds
 
+# Responses asking clients to slow down; these are not retried immediately
+BACKOFF_STATUS_CODES = frozenset({429, 503})
 
-@dataclass
+
+def create_session() -> AsyncSession:
+    """Create a curl_cffi session configured for the airport website.
+
+    Returns:
+        AsyncSession impersonating Chrome to get past bot detection
+    """
+    return AsyncSession(
+        impersonate="chrome120",
+        verify=True,  # Verify SSL certificates
+        timeout=REQUEST_TIMEOUT,  # Default timeout for all requests
+        allow_redirects=True,  # Follow redirects
+        max_redirects=5,  # Limit redirect chains
+        curl_options={
+            CurlOpt.MAXAGE_CONN: CONNECTION_MAX_IDLE,  # Drop stale pooled connections
+            CurlOpt.TCP_KEEPALIVE: 1,  # Detect half-closed sockets early
+            # Wait for an in-progress HTTP/2 connection instead of opening a
+            # second one, so concurrent board fetches share one TLS connection
+            CurlOpt.PIPEWAIT: 1,
+        },
+    )
+
+
+@dataclass(slots=True)
 class Flight:
     """Flight data model."""
 
@@ -47,6 +88,17 @@ class Flight:
     status: FlightStatus  # enum
     delay_minutes: int | None  # calculated delay
     direction: str  # "arrival" | "departure"
+    sched_min: int | None = field(init=False, repr=False, compare=False)  # minutes of day
+    airline_upper: str = field(init=False, repr=False, compare=False)
+    flight_number_upper: str = field(init=False, repr=False, compare=False)
+    location_lower: str = field(init=False, repr=False, compare=False)  # dest or origin
+
+    def __post_init__(self) -> None:
+        """Precompute derived fields used when filtering and sorting."""
+        self.sched_min = _time_to_minutes(self.scheduled_time)
+        self.airline_upper = self.airline.upper()
+        self.flight_number_upper = self.flight_number.upper()
+        self.location_lower = (self.destination or self.origin or "").lower()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert flight to dictionary."""
@@ -63,6 +115,28 @@ class Flight:
         }
 
 
+def _time_to_minutes(time_str: str | None) -> int | None:
+    """Convert HH:MM time to minutes since midnight.
+
+    Args:
+        time_str: Time in HH:MM format
+
+    Returns:
+        Minutes since midnight, or None if the time cannot be parsed
+    """
+    if not time_str:
+        return None
+
+    try:
+        hours, minutes = map(int, time_str.split(":"))
+    except ValueError:
+        return None
+
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
 def _calculate_delay(scheduled_time: str, expected_time: str | None) -> int | None:
     """Calculate delay in minutes between scheduled and expected time.
 
@@ -80,27 +154,21 @@ def _calculate_delay(scheduled_time: str, expected_time: str | None) -> int | No
     if not expected_time or not scheduled_time:
         return None
 
-    try:
-        # Parse times
-        sched_h, sched_m = map(int, scheduled_time.split(":"))
-        exp_h, exp_m = map(int, expected_time.split(":"))
-
-        # Create datetime objects for today
-        today = datetime.now().replace(second=0, microsecond=0)
-        scheduled = today.replace(hour=sched_h, minute=sched_m)
-        expected = today.replace(hour=exp_h, minute=exp_m)
-
-        # Handle midnight crossing (e.g., 23:50 -> 00:20)
-        # If expected < scheduled, it means the delay caused midnight crossing
-        if expected < scheduled:
-            expected += timedelta(days=1)
-
-        delay = (expected - scheduled).total_seconds() / 60
-        return int(delay)
-    except (ValueError, AttributeError) as err:
-        _LOGGER.debug("Could not calculate delay: %s", err)
+    sched_min = _time_to_minutes(scheduled_time)
+    exp_min = _time_to_minutes(expected_time)
+    if sched_min is None or exp_min is None:
+        _LOGGER.debug("Could not calculate delay: %s -> %s", scheduled_time, expected_time)
         return None
 
+    delay = exp_min - sched_min
+
+    # Handle midnight crossing (e.g., 23:50 -> 00:20)
+    # If expected < scheduled, it means the delay caused midnight crossing
+    if delay < 0:
+        delay += 24 * 60
+
+    return delay
+
 
 def _parse_status_from_remarks(remarks: str, remarks_status: int, direction: str) -> FlightStatus:
     """Parse flight status from remarks and remarksStatus code.
@@ -162,14 +230,14 @@ def _extract_json_from_react_props(soup: BeautifulSoup) -> dict[str, Any] | None
     """
     try:
         # Find the React component container
-        react_container = soup.find("div", {"data-controller": "symfony--ux-react--react"})
+        react_container = soup.find("div", {"data-controller": REACT_CONTROLLER})
 
         if not react_container:
             _LOGGER.warning("React component container not found")
             return None
 
         # Extract the props data attribute
-        props_data = react_container.get("data-symfony--ux-react--react-props-value")
+        props_data = react_container.get(REACT_PROPS_ATTR)
 
         if not props_data:
             _LOGGER.warning("React props data attribute not found")
@@ -204,7 +272,7 @@ def _extract_time_from_status(status_text: str) -> str | None:
         return None
 
     # Look for time pattern HH:MM
-    match = re.search(r"\b(\d{1,2}:\d{2})\b", status_text)
+    match = TIME_PATTERN.search(status_text)
     if match:
         return match.group(1)
     return None
@@ -237,7 +305,7 @@ def _parse_flight_from_json(flight_data: dict[str, Any], direction: str) -> Flig
         if not flight_number:
             return None
 
-        airline = flight_data.get("carrierName", "")
+        airline = flight_data.get("carrierName") or ""  # may be null
         location = flight_data.get("origin" if direction == DIRECTION_ARRIVALS else "destination", "")
 
         # Parse scheduled time from ISO datetime
@@ -374,7 +442,14 @@ def _parse_html(html_content: str, direction: str) -> list[Flight]:
         List of Flight objects
     """
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
+        # Pages with React props only need the component container, so skip
+        # building a tree for the rest of the page
+        react_page = REACT_PROPS_ATTR in html_content
+        soup = BeautifulSoup(
+            html_content,
+            "html.parser",
+            parse_only=_REACT_CONTAINER if react_page else None,
+        )
 
         # Try new JSON-based format first
         json_data = _extract_json_from_react_props(soup)
@@ -412,6 +487,8 @@ def _parse_html(html_content: str, direction: str) -> list[Flight]:
 
         # Fallback to old HTML scraping method
         _LOGGER.debug("Using HTML scraping (legacy format)")
+        if react_page:
+            soup = BeautifulSoup(html_content, "html.parser")
         flight_elements = soup.find_all("div", class_="table__element")
 
         if not flight_elements:
@@ -433,15 +510,75 @@ def _parse_html(html_content: str, direction: str) -> list[Flight]:
         return []
 
 
+def is_rate_limited(error: BaseException) -> bool:
+    """Check whether an error is the website asking us to back off.
+
+    Args:
+        error: Exception raised while fetching
+
+    Returns:
+        True for HTTP 429/503 responses
+    """
+    return (
+        isinstance(error, HTTPError)
+        and error.response is not None
+        and error.response.status_code in BACKOFF_STATUS_CODES
+    )
+
+
+def retry_after_seconds(response: Any) -> float | None:
+    """Get the delay requested by a Retry-After header.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    # Delay in seconds
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    # HTTP date
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+@dataclass
+class BoardCache:
+    """Validators and flights from the last full response for one board."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    flights: list[Flight] = field(default_factory=list)
+
+
 async def fetch_flights(
     session: AsyncSession,
     direction: str,
+    timeout: float | tuple[float, float] | None = None,
+    cache: BoardCache | None = None,
 ) -> list[Flight]:
     """Fetch and parse flights from airport website with retry logic.
 
     Args:
         session: curl_cffi AsyncSession
         direction: "arrivals" or "departures"
+        timeout: Per-request timeout in seconds, or a (connect, read) tuple.
+            Defaults to the session-level timeout when None.
+        cache: Board cache used for conditional requests. Updated in place
+            after a full response; its flights are returned on 304.
 
     Returns:
         List of Flight objects
@@ -449,7 +586,7 @@ async def fetch_flights(
     Raises:
         Exception: On HTTP errors or timeout after all retries
     """
-    url = URL_ARRIVALS if direction == DIRECTION_ARRIVALS else URL_DEPARTURES
+    url = URL_BY_DIRECTION[direction]
 
     _LOGGER.debug("Fetching flights from %s", url)
 
@@ -459,6 +596,11 @@ async def fetch_flights(
     headers = {
         "Accept-Language": "pl-PL,pl;q=0.9,en-US;q=0.8,en;q=0.7",  # Prefer Polish
     }
+    if cache is not None:
+        if cache.etag:
+            headers["If-None-Match"] = cache.etag
+        if cache.last_modified:
+            headers["If-Modified-Since"] = cache.last_modified
 
     last_error = None
 
@@ -476,11 +618,26 @@ async def fetch_flights(
                 await asyncio.sleep(delay)
 
             # Make request (session already configured with timeout, redirects, verify)
-            response = await session.get(url, headers=headers)
+            if timeout is None:
+                response = await session.get(url, headers=headers)
+            else:
+                response = await session.get(url, headers=headers, timeout=timeout)
             response.raise_for_status()
+
+            if cache is not None and response.status_code == 304:
+                _LOGGER.debug("%s not modified, reusing cached flights", direction)
+                return cache.flights
+
             html = response.text
 
-            flights = _parse_html(html, direction)
+            # Parsing is CPU-bound; keep it off the event loop
+            flights = await asyncio.get_running_loop().run_in_executor(
+                None, _parse_html, html, direction
+            )
+            if cache is not None:
+                cache.etag = response.headers.get("ETag")
+                cache.last_modified = response.headers.get("Last-Modified")
+                cache.flights = flights
             _LOGGER.info(
                 "Successfully fetched %d %s", len(flights), direction
             )
@@ -490,6 +647,9 @@ async def fetch_flights(
             last_error = err
             _LOGGER.warning("Timeout fetching %s from %s (attempt %d/%d)", direction, url, attempt + 1, MAX_RETRIES + 1)
         except Exception as err:
+            if is_rate_limited(err):
+                # Retrying right away would only prolong the rate limit
+                raise
             last_error = err
             _LOGGER.warning("Error fetching %s (attempt %d/%d): %s", direction, attempt + 1, MAX_RETRIES + 1, err)
 
@@ -508,6 +668,7 @@ async def fetch_all_flights(
     session: AsyncSession,
     fetch_arrivals: bool = True,
     fetch_departures: bool = True,
+    caches: dict[str, BoardCache] | None = None,
 ) -> dict[str, list[Flight]]:
     """Fetch both arrivals and departures.
 
@@ -515,32 +676,64 @@ async def fetch_all_flights(
         session: curl_cffi AsyncSession
         fetch_arrivals: Whether to fetch arrivals
         fetch_departures: Whether to fetch departures
+        caches: Board caches for conditional requests, keyed by direction.
+            A direction that fails to fetch falls back to its cached flights
+            when another direction was fetched.
 
     Returns:
         Dictionary with 'arrivals' and 'departures' keys containing flight lists
+
+    Raises:
+        HTTPError: If the site rate limits any request
+        Exception: The first error, if every requested direction fails
     """
     tasks = []
     keys = []
+    caches = caches or {}
 
     if fetch_arrivals:
-        tasks.append(fetch_flights(session, DIRECTION_ARRIVALS))
+        tasks.append(
+            fetch_flights(session, DIRECTION_ARRIVALS, cache=caches.get(DIRECTION_ARRIVALS))
+        )
         keys.append(DIRECTION_ARRIVALS)
 
     if fetch_departures:
-        tasks.append(fetch_flights(session, DIRECTION_DEPARTURES))
+        tasks.append(
+            fetch_flights(session, DIRECTION_DEPARTURES, cache=caches.get(DIRECTION_DEPARTURES))
+        )
         keys.append(DIRECTION_DEPARTURES)
 
     if not tasks:
         return {DIRECTION_ARRIVALS: [], DIRECTION_DEPARTURES: []}
 
-    try:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
 
+    # The site asked us to slow down; let the caller back off
+    for result in results:
+        if is_rate_limited(result):
+            raise result
+
+    # Only fill in a failed board from cache when another board was fetched;
+    # if every board failed, let the caller fall back to its last data
+    if all(isinstance(result, Exception) for result in results):
+        raise results[0]
+
+    try:
         output = {}
         for key, result in zip(keys, results):
             if isinstance(result, Exception):
-                _LOGGER.error("Failed to fetch %s: %s", key, result)
-                output[key] = []
+                cache = caches.get(key)
+                if cache is not None and cache.flights:
+                    # Keep the last fetched board rather than blanking one side
+                    _LOGGER.warning(
+                        "Failed to fetch %s, reusing last fetched flights: %s",
+                        key,
+                        result,
+                    )
+                    output[key] = cache.flights
+                else:
+                    _LOGGER.error("Failed to fetch %s: %s", key, result)
+                    output[key] = []
             else:
                 output[key] = result
 
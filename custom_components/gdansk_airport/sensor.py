@@ -170,6 +170,10 @@ class GdanskAirportSensor(CoordinatorEntity[GdanskAirportCoordinator], SensorEnt
         super().__init__(coordinator)
         self.entity_description = description
 
+        # Attributes built from the coordinator data they were computed for
+        self._attributes_data: dict[str, Any] | None = None
+        self._attributes: dict[str, Any] = {}
+
         # Set unique ID
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
 
@@ -205,15 +209,34 @@ class GdanskAirportSensor(CoordinatorEntity[GdanskAirportCoordinator], SensorEnt
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes.
 
+        Attributes are rebuilt only when the coordinator publishes new data,
+        not on every state read.
+
         Returns:
             Dictionary of attributes
         """
-        if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
+        data = self.coordinator.data
+        if data is not self._attributes_data:
+            self._attributes = self._build_attributes(data)
+            self._attributes_data = data
+
+        return self._attributes
+
+    def _build_attributes(self, data: Any) -> dict[str, Any]:
+        """Build the state attributes from coordinator data.
+
+        Args:
+            data: Coordinator data
+
+        Returns:
+            Dictionary of attributes
+        """
+        if not data or not isinstance(data, dict):
             return {}
 
         if self.entity_description.attributes_fn:
             try:
-                return self.entity_description.attributes_fn(self.coordinator.data)
+                return self.entity_description.attributes_fn(data)
             except (KeyError, TypeError, AttributeError) as err:
                 _LOGGER.debug("Error getting sensor attributes for %s: %s", self.entity_description.key, err)
                 return {}
@@ -16,25 +16,28 @@ from .coordinator import GdanskAirportCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# Flight number validation pattern (e.g., "W6 1706", "LO 123", "FR1234")
-FLIGHT_NUMBER_PATTERN = re.compile(r"^[A-Z0-9]{2}\s*\d{1,4}[A-Z]?$", re.IGNORECASE)
+# Flight number validation pattern (e.g., "W6 1706", "LO 123", "FR1234"),
+# matched against upper-cased input
+FLIGHT_NUMBER_PATTERN = re.compile(r"[A-Z0-9]{2}\s*\d{1,4}[A-Z]?")
 
 # Service names
 SERVICE_TRACK_FLIGHT = "track_flight"
 SERVICE_UNTRACK_FLIGHT = "untrack_flight"
 
-# Service schemas
-TRACK_FLIGHT_SCHEMA = vol.Schema(
-    {
-        vol.Required("flight_number"): cv.string,
-    }
-)
 
-UNTRACK_FLIGHT_SCHEMA = vol.Schema(
-    {
-        vol.Required("flight_number"): cv.string,
-    }
-)
+def normalize_flight_number(flight_number: str) -> str | None:
+    """Normalize flight number and validate its format.
+
+    Args:
+        flight_number: Flight number as entered by the user
+
+    Returns:
+        Upper-cased flight number, or None if the format is invalid
+    """
+    normalized = flight_number.strip().upper()
+    if FLIGHT_NUMBER_PATTERN.fullmatch(normalized) is None:
+        return None
+    return normalized
 
 
 def validate_flight_number(flight_number: str) -> bool:
@@ -46,7 +49,41 @@ def validate_flight_number(flight_number: str) -> bool:
     Returns:
         True if valid format, False otherwise
     """
-    return bool(FLIGHT_NUMBER_PATTERN.match(flight_number.strip()))
+    return normalize_flight_number(flight_number) is not None
+
+
+def _valid_flight_number(value: Any) -> str:
+    """Validate and normalize a flight number in a service schema.
+
+    Args:
+        value: Raw service call value
+
+    Returns:
+        Upper-cased flight number
+
+    Raises:
+        vol.Invalid: If the flight number format is invalid
+    """
+    normalized = normalize_flight_number(cv.string(value))
+    if normalized is None:
+        raise vol.Invalid(
+            f"Invalid flight number format: {value} (expected format: 'W6 1706', 'LO 123')"
+        )
+    return normalized
+
+
+# Service schemas
+TRACK_FLIGHT_SCHEMA = vol.Schema(
+    {
+        vol.Required("flight_number"): _valid_flight_number,
+    }
+)
+
+UNTRACK_FLIGHT_SCHEMA = vol.Schema(
+    {
+        vol.Required("flight_number"): _valid_flight_number,
+    }
+)
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
@@ -62,17 +99,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         Args:
             call: Service call data
         """
-        flight_number = call.data["flight_number"].strip()
-
-        # Validate flight number format
-        if not validate_flight_number(flight_number):
-            _LOGGER.error(
-                "Invalid flight number format: %s (expected format: 'W6 1706', 'LO 123')",
-                flight_number,
-            )
-            return
-
-        flight_number = flight_number.upper()
+        # Already validated and normalized by the service schema
+        flight_number = call.data["flight_number"]
 
         # Get all config entries for this integration
         entries = hass.config_entries.async_entries(DOMAIN)
@@ -82,18 +110,21 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             return
 
         # Add to all configured integrations
+        domain_data = hass.data[DOMAIN]
         for entry in entries:
-            coordinator: GdanskAirportCoordinator = hass.data[DOMAIN][entry.entry_id][
-                "coordinator"
-            ]
+            coordinator: GdanskAirportCoordinator = domain_data[entry.entry_id]["coordinator"]
 
             # Add to coordinator's tracked flights (using public method)
-            coordinator.add_tracked_flight(flight_number)
+            if not coordinator.add_tracked_flight(flight_number):
+                _LOGGER.debug("Flight %s is already tracked", flight_number)
+                continue
 
             # Update config entry options
-            new_options = dict(entry.options)
             tracked_set = coordinator.get_tracked_flights()
-            new_options[CONF_TRACKED_FLIGHTS] = ", ".join(sorted(tracked_set))
+            new_options = {
+                **entry.options,
+                CONF_TRACKED_FLIGHTS: ", ".join(sorted(tracked_set)),
+            }
 
             hass.config_entries.async_update_entry(entry, options=new_options)
 
@@ -105,17 +136,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         Args:
             call: Service call data
         """
-        flight_number = call.data["flight_number"].strip()
-
-        # Validate flight number format
-        if not validate_flight_number(flight_number):
-            _LOGGER.error(
-                "Invalid flight number format: %s (expected format: 'W6 1706', 'LO 123')",
-                flight_number,
-            )
-            return
-
-        flight_number = flight_number.upper()
+        # Already validated and normalized by the service schema
+        flight_number = call.data["flight_number"]
 
         # Get all config entries for this integration
         entries = hass.config_entries.async_entries(DOMAIN)
@@ -125,18 +147,21 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             return
 
         # Remove from all configured integrations
+        domain_data = hass.data[DOMAIN]
         for entry in entries:
-            coordinator: GdanskAirportCoordinator = hass.data[DOMAIN][entry.entry_id][
-                "coordinator"
-            ]
+            coordinator: GdanskAirportCoordinator = domain_data[entry.entry_id]["coordinator"]
 
             # Remove from coordinator's tracked flights (using public method)
-            coordinator.remove_tracked_flight(flight_number)
+            if not coordinator.remove_tracked_flight(flight_number):
+                _LOGGER.debug("Flight %s is not tracked", flight_number)
+                continue
 
             # Update config entry options
-            new_options = dict(entry.options)
             tracked_set = coordinator.get_tracked_flights()
-            new_options[CONF_TRACKED_FLIGHTS] = ", ".join(sorted(tracked_set))
+            new_options = {
+                **entry.options,
+                CONF_TRACKED_FLIGHTS: ", ".join(sorted(tracked_set)),
+            }
 
             hass.config_entries.async_update_entry(entry, options=new_options)
 
@@ -1,20 +1,25 @@
 """Flight state tracking for detecting changes between updates."""
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 from .const import FlightStatus
 from .parser import Flight
 
 
-@dataclass
+@dataclass(slots=True)
 class FlightStateChange:
     """Represents a detected change in flight state."""
 
     flight: Flight
     old_status: FlightStatus
     new_status: FlightStatus
-    delay_changed: bool = False
     old_delay: int | None = None
     new_delay: int | None = None
+    delay_changed: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive whether the delay changed from the two delay values."""
+        self.delay_changed = self.old_delay != self.new_delay
 
 
 class FlightStateTracker:
@@ -22,62 +27,52 @@ class FlightStateTracker:
 
     def __init__(self):
         """Initialize the state tracker."""
-        self._states: dict[str, tuple[FlightStatus, int | None]] = {}
+        self._states: dict[tuple[str, str, str], tuple[FlightStatus, int | None]] = {}
 
-    def get_flight_key(self, flight: Flight) -> str:
+    def get_flight_key(self, flight: Flight) -> tuple[str, str, str]:
         """Generate unique key for flight.
 
         Args:
             flight: Flight object
 
         Returns:
-            Unique string key combining flight number, scheduled time, and direction
+            Unique key of flight number, scheduled time, and direction
         """
-        return f"{flight.flight_number}_{flight.scheduled_time}_{flight.direction}"
+        return (flight.flight_number, flight.scheduled_time, flight.direction)
 
-    def detect_changes(self, flights: list[Flight]) -> list[FlightStateChange]:
+    def detect_changes(self, flights: Iterable[Flight]) -> list[FlightStateChange]:
         """Detect changes in flight states compared to previous update.
 
         Args:
-            flights: List of current flights
+            flights: Current flights, iterated once
 
         Returns:
             List of FlightStateChange objects for flights that changed
         """
         changes = []
         new_states = {}
+        old_states = self._states
 
         for flight in flights:
             key = self.get_flight_key(flight)
-            new_states[key] = (flight.status, flight.delay_minutes)
-
-            if key in self._states:
-                old_status, old_delay = self._states[key]
-
-                # Check for status change
-                if old_status != flight.status:
-                    changes.append(
-                        FlightStateChange(
-                            flight=flight,
-                            old_status=old_status,
-                            new_status=flight.status,
-                            delay_changed=old_delay != flight.delay_minutes,
-                            old_delay=old_delay,
-                            new_delay=flight.delay_minutes,
-                        )
-                    )
-                # Check for delay change only (status same)
-                elif old_delay != flight.delay_minutes:
-                    changes.append(
-                        FlightStateChange(
-                            flight=flight,
-                            old_status=old_status,
-                            new_status=flight.status,
-                            delay_changed=True,
-                            old_delay=old_delay,
-                            new_delay=flight.delay_minutes,
-                        )
-                    )
+            state = (flight.status, flight.delay_minutes)
+            new_states[key] = state
+
+            # Report status and/or delay changes of flights seen before
+            old_state = old_states.get(key)
+            if old_state is None or old_state == state:
+                continue
+
+            old_status, old_delay = old_state
+            changes.append(
+                FlightStateChange(
+                    flight=flight,
+                    old_status=old_status,
+                    new_status=flight.status,
+                    old_delay=old_delay,
+                    new_delay=flight.delay_minutes,
+                )
+            )
 
         # Update tracked states
         self._states = new_states
@@ -4,7 +4,18 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from custom_components.gdansk_airport.config_flow import validate_connection
+from homeassistant.data_entry_flow import AbortFlow
+
+from custom_components.gdansk_airport.config_flow import (
+    GdanskAirportConfigFlow,
+    validate_connection,
+)
+from custom_components.gdansk_airport.const import (
+    CONF_DIRECTION,
+    DATA_SESSION,
+    DIRECTION_ARRIVALS,
+    DOMAIN,
+)
 
 
 async def test_validate_connection_success():
@@ -102,3 +113,123 @@ async def test_validate_connection_logs_error_details():
         # Check that error type was logged
         error_calls = [str(call) for call in mock_logger.error.call_args_list]
         assert any("TestError" in str(call) for call in error_calls)
+
+
+async def test_validate_connection_closes_temporary_session():
+    """Test that a temporary session is created and closed without a shared one."""
+    mock_hass = Mock()
+    mock_hass.data = {}
+    temp_session = AsyncMock()
+
+    with patch(
+        "custom_components.gdansk_airport.config_flow.create_session",
+        return_value=temp_session,
+    ), patch(
+        "custom_components.gdansk_airport.config_flow.fetch_flights",
+        new_callable=AsyncMock,
+        return_value=[],
+    ) as mock_fetch:
+        await validate_connection(mock_hass)
+
+    assert mock_fetch.call_args.args[0] is temp_session
+    temp_session.close.assert_awaited_once()
+
+
+async def test_validate_connection_closes_temporary_session_on_error():
+    """Test that a temporary session is closed when validation fails."""
+    mock_hass = Mock()
+    mock_hass.data = {}
+    temp_session = AsyncMock()
+
+    with patch(
+        "custom_components.gdansk_airport.config_flow.create_session",
+        return_value=temp_session,
+    ), patch(
+        "custom_components.gdansk_airport.config_flow.fetch_flights",
+        new_callable=AsyncMock,
+        side_effect=Exception("Connection failed"),
+    ):
+        with pytest.raises(Exception):
+            await validate_connection(mock_hass)
+
+    temp_session.close.assert_awaited_once()
+
+
+async def test_validate_connection_reuses_shared_session():
+    """Test that the integration's shared session is reused and left open."""
+    shared_session = AsyncMock()
+    mock_hass = Mock()
+    mock_hass.data = {DATA_SESSION: shared_session}
+
+    with patch(
+        "custom_components.gdansk_airport.config_flow.create_session"
+    ) as mock_create, patch(
+        "custom_components.gdansk_airport.config_flow.fetch_flights",
+        new_callable=AsyncMock,
+        return_value=[],
+    ) as mock_fetch:
+        await validate_connection(mock_hass)
+
+    mock_create.assert_not_called()
+    assert mock_fetch.call_args.args[0] is shared_session
+    shared_session.close.assert_not_awaited()
+
+
+def _create_flow() -> GdanskAirportConfigFlow:
+    """Create a config flow bound to a mock Home Assistant instance."""
+    flow = GdanskAirportConfigFlow()
+    flow.hass = Mock()
+    flow.handler = DOMAIN
+    flow.flow_id = "test_flow"
+    return flow
+
+
+async def test_step_user_builtin_timeout():
+    """Test that a builtin TimeoutError is reported as timeout_connect."""
+    flow = _create_flow()
+
+    with patch(
+        "custom_components.gdansk_airport.config_flow.validate_connection",
+        new_callable=AsyncMock,
+        side_effect=TimeoutError(),
+    ):
+        result = await flow.async_step_user({CONF_DIRECTION: DIRECTION_ARRIVALS})
+
+    assert result["type"] == "form"
+    assert result["errors"] == {"base": "timeout_connect"}
+
+
+async def test_step_user_connection_error():
+    """Test that other connection errors are reported as cannot_connect."""
+    flow = _create_flow()
+
+    with patch(
+        "custom_components.gdansk_airport.config_flow.validate_connection",
+        new_callable=AsyncMock,
+        side_effect=Exception("Connection failed"),
+    ):
+        result = await flow.async_step_user({CONF_DIRECTION: DIRECTION_ARRIVALS})
+
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_step_user_already_configured_aborts():
+    """Test that a duplicate unique ID aborts instead of showing an error."""
+    flow = _create_flow()
+
+    with patch(
+        "custom_components.gdansk_airport.config_flow.validate_connection",
+        new_callable=AsyncMock,
+        return_value=True,
+    ), patch.object(
+        flow, "async_set_unique_id", new_callable=AsyncMock
+    ) as mock_set_unique_id, patch.object(
+        flow,
+        "_abort_if_unique_id_configured",
+        side_effect=AbortFlow("already_configured"),
+    ):
+        with pytest.raises(AbortFlow) as exc_info:
+            await flow.async_step_user({CONF_DIRECTION: DIRECTION_ARRIVALS})
+
+    assert exc_info.value.reason == "already_configured"
+    mock_set_unique_id.assert_awaited_once_with("gdansk_airport_arrivals")
@@ -0,0 +1,77 @@
+"""Tests for Gdańsk Airport constants and status parsing."""
+from custom_components.gdansk_airport.const import (
+    FlightStatus,
+    _build_prefix_buckets,
+    _parse_status_cached,
+    parse_status,
+)
+
+
+class TestParseStatus:
+    """Tests for parse_status function."""
+
+    def test_exact_match(self):
+        """Test exact status text match."""
+        assert parse_status("WYLĄDOWAŁ") == FlightStatus.LANDED
+
+    def test_lowercase_with_whitespace(self):
+        """Test status text is normalized before matching."""
+        assert parse_status("  boarding ") == FlightStatus.BOARDING
+
+    def test_prefix_match_with_time(self):
+        """Test status text with additional time info."""
+        assert parse_status("OPÓŹNIONY 00:32") == FlightStatus.DELAYED
+
+    def test_prefix_match_check_in(self):
+        """Test check-in status with opening time."""
+        assert parse_status("ODPRAWA OD 03:40") == FlightStatus.CHECK_IN
+
+    def test_prefix_match_gate(self):
+        """Test multi-word prefix match."""
+        assert parse_status("DO WYJŚCIA 12") == FlightStatus.GATE
+
+    def test_lowercase_diacritics(self):
+        """Test lowercase text with Polish diacritics."""
+        assert parse_status("odwołany") == FlightStatus.CANCELLED
+
+    def test_ascii_spelling(self):
+        """Test ASCII spelling maps to the same status as the diacritic one."""
+        assert parse_status("GATE ZAMKNIETY") == parse_status("GATE ZAMKNIĘTY")
+
+    def test_unknown_status(self):
+        """Test unrecognized status text."""
+        assert parse_status("SOMETHING ELSE") == FlightStatus.UNKNOWN
+
+    def test_empty_status(self):
+        """Test empty status text."""
+        assert parse_status("") == FlightStatus.UNKNOWN
+
+    def test_none_status(self):
+        """Test None status text is handled without hitting the cache."""
+        assert parse_status(None) == FlightStatus.UNKNOWN
+
+    def test_repeated_status_is_cached(self):
+        """Test repeated status texts are served from the cache."""
+        _parse_status_cached.cache_clear()
+
+        parse_status("WYLĄDOWAŁ")
+        parse_status("WYLĄDOWAŁ")
+
+        info = _parse_status_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestBuildPrefixBuckets:
+    """Tests for _build_prefix_buckets function."""
+
+    def test_longest_key_first(self):
+        """Test that longer keys are tried before their shorter prefixes."""
+        buckets = _build_prefix_buckets(
+            {
+                "GATE": FlightStatus.GATE,
+                "GATE ZAMKNIETY": FlightStatus.GATE_CLOSED,
+            }
+        )
+
+        assert [key for key, _ in buckets["GA"]] == ["GATE ZAMKNIETY", "GATE"]
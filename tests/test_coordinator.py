@@ -0,0 +1,417 @@
+"""Tests for Gdańsk Airport data coordinator."""
+import asyncio
+from datetime import datetime, timedelta
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+from curl_cffi.requests.exceptions import HTTPError
+import pytest
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.gdansk_airport.const import (
+    DIRECTION_ARRIVALS,
+    DIRECTION_BOTH,
+    DIRECTION_DEPARTURES,
+    EVENT_FLIGHT_LANDED,
+    EVENT_FLIGHT_STATUS_CHANGED,
+    FlightStatus,
+)
+from custom_components.gdansk_airport.coordinator import GdanskAirportCoordinator
+from custom_components.gdansk_airport.parser import Flight
+
+NOW = datetime(2026, 2, 16, 12, 0)
+
+
+@pytest.fixture
+def coordinator():
+    """Create a coordinator with default options."""
+    hass = Mock()
+    hass.async_create_background_task.side_effect = (
+        lambda target, name: asyncio.create_task(target, name=name)
+    )
+    return GdanskAirportCoordinator(
+        hass,
+        direction=DIRECTION_BOTH,
+        scan_interval=timedelta(minutes=5),
+        session=AsyncMock(),
+    )
+
+
+@pytest.fixture
+def fixed_now():
+    """Freeze the coordinator's clock at NOW."""
+    with patch(
+        "custom_components.gdansk_airport.coordinator.datetime", wraps=datetime
+    ) as mock_datetime:
+        mock_datetime.now.return_value = NOW
+        yield mock_datetime
+
+
+@pytest.fixture
+def monotonic():
+    """Control the coordinator's monotonic clock."""
+    with patch("custom_components.gdansk_airport.coordinator.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time.monotonic
+
+
+def make_flight(
+    scheduled_time: str,
+    flight_number: str = "LO 123",
+    status: FlightStatus = FlightStatus.EXPECTED,
+    airline: str = "LOT",
+    origin: str = "Warsaw",
+) -> Flight:
+    """Create an arrival flight."""
+    return Flight(
+        scheduled_time=scheduled_time,
+        expected_time=None,
+        origin=origin,
+        destination=None,
+        airline=airline,
+        flight_number=flight_number,
+        status=status,
+        delay_minutes=None,
+        direction=DIRECTION_ARRIVALS,
+    )
+
+
+class TestFilterFlights:
+    """Tests for _filter_flights method."""
+
+    def test_time_window(self, coordinator, fixed_now):
+        """Test flights outside the time window are dropped."""
+        coordinator.time_window_hours = 2
+
+        flights = [
+            make_flight("09:30", "LO 1"),
+            make_flight("10:30", "LO 2"),
+            make_flight("13:59", "LO 3"),
+            make_flight("14:30", "LO 4"),
+        ]
+
+        result = coordinator._filter_flights(flights)
+
+        assert [f.flight_number for f in result] == ["LO 2", "LO 3"]
+
+    def test_next_day_flight(self, coordinator, fixed_now):
+        """Test early-morning flights count as next day late in the evening."""
+        coordinator.time_window_hours = 2
+        fixed_now.now.return_value = datetime(2026, 2, 16, 23, 30)
+
+        result = coordinator._filter_flights([make_flight("00:45")])
+
+        assert len(result) == 1
+
+    def test_invalid_time_kept(self, coordinator, fixed_now):
+        """Test flights with unparsable times are not filtered by time."""
+        result = coordinator._filter_flights([make_flight("--:--")])
+
+        assert len(result) == 1
+
+    def test_hide_landed_and_cancelled(self, coordinator, fixed_now):
+        """Test status-based filtering."""
+        coordinator.hide_landed = True
+        coordinator.hide_cancelled = True
+
+        flights = [
+            make_flight("12:00", "LO 1", FlightStatus.LANDED),
+            make_flight("12:00", "LO 2", FlightStatus.CANCELLED),
+            make_flight("12:00", "LO 3", FlightStatus.DELAYED),
+        ]
+
+        result = coordinator._filter_flights(flights)
+
+        assert [f.flight_number for f in result] == ["LO 3"]
+
+    def test_airline_and_destination_filters(self, coordinator, fixed_now):
+        """Test airline and origin filtering."""
+        coordinator.update_options(
+            {"airlines_filter": "wizz air, lot", "destinations_filter": "warsaw"}
+        )
+
+        flights = [
+            make_flight("12:00", "LO 1", airline="LOT", origin="Warsaw Chopin"),
+            make_flight("12:00", "W6 2", airline="Wizz Air", origin="London"),
+            make_flight("12:00", "FR 3", airline="RYANAIR", origin="Warsaw Modlin"),
+        ]
+
+        result = coordinator._filter_flights(flights)
+
+        assert [f.flight_number for f in result] == ["LO 1"]
+
+    def test_sorted_and_limited(self, coordinator, fixed_now):
+        """Test flights are sorted by scheduled time and capped at max_flights."""
+        coordinator.max_flights = 2
+
+        flights = [
+            make_flight("13:00", "LO 3"),
+            make_flight("11:00", "LO 1"),
+            make_flight("12:00", "LO 2"),
+        ]
+
+        result = coordinator._filter_flights(flights)
+
+        assert [f.flight_number for f in result] == ["LO 1", "LO 2"]
+
+
+class TestGetNextFlight:
+    """Tests for _get_next_flight method."""
+
+    def test_skips_finished_flights(self, coordinator):
+        """Test that landed, departed and cancelled flights are skipped."""
+        flights = [
+            make_flight("11:00", "LO 1", FlightStatus.LANDED),
+            make_flight("11:10", "LO 2", FlightStatus.DEPARTED),
+            make_flight("11:20", "LO 3", FlightStatus.CANCELLED),
+            make_flight("11:30", "LO 4", FlightStatus.DELAYED),
+        ]
+
+        assert coordinator._get_next_flight(flights).flight_number == "LO 4"
+
+    def test_prefers_expected_time(self, coordinator):
+        """Test that flights are ordered by expected time when known."""
+        delayed = make_flight("11:00", "LO 1", FlightStatus.DELAYED)
+        delayed.expected_time = "11:45"
+        flights = [delayed, make_flight("11:30", "LO 2")]
+
+        assert coordinator._get_next_flight(flights).flight_number == "LO 2"
+
+    def test_no_upcoming_flights(self, coordinator):
+        """Test that None is returned when every flight is finished."""
+        flights = [make_flight("11:00", "LO 1", FlightStatus.LANDED)]
+
+        assert coordinator._get_next_flight(flights) is None
+        assert coordinator._get_next_flight([]) is None
+
+
+class TestProcessStateChanges:
+    """Tests for _process_state_changes method."""
+
+    def test_status_change_fires_events(self, coordinator):
+        """Test that a status change fires specific and generic events."""
+        coordinator.update_options({"events_enabled": True, "events_all_flights": True})
+        coordinator._process_state_changes([make_flight("12:00", "LO 1")])
+
+        coordinator._process_state_changes(
+            [make_flight("12:00", "LO 1", FlightStatus.LANDED)]
+        )
+
+        fired = coordinator.hass.bus.async_fire.call_args_list
+        assert [c.args[0] for c in fired] == [
+            EVENT_FLIGHT_LANDED,
+            EVENT_FLIGHT_STATUS_CHANGED,
+        ]
+        assert fired[0].args[1]["old_status"] == FlightStatus.EXPECTED.value
+        coordinator.hass.bus.fire.assert_not_called()
+
+    def test_untracked_flight_fires_nothing(self, coordinator):
+        """Test that only tracked flights fire events by default."""
+        coordinator.update_options({"events_enabled": True, "tracked_flights": "LO 2"})
+        coordinator._process_state_changes([make_flight("12:00", "LO 1")])
+
+        coordinator._process_state_changes(
+            [make_flight("12:00", "LO 1", FlightStatus.LANDED)]
+        )
+
+        coordinator.hass.bus.async_fire.assert_not_called()
+
+
+class TestUpdateOptions:
+    """Tests for update_options method."""
+
+    def test_filters_parsed_once(self, coordinator):
+        """Test that filter strings are normalized into immutable collections."""
+        coordinator.update_options(
+            {
+                "airlines_filter": " wizz air, LOT ,, lot",
+                "destinations_filter": "Warsaw, , London ",
+            }
+        )
+
+        assert coordinator.airlines_filter == frozenset({"WIZZ AIR", "LOT"})
+        assert coordinator.destinations_filter == ("warsaw", "london")
+
+    def test_tracked_flights_parsed(self, coordinator):
+        """Test that tracked flights are normalized to upper case."""
+        coordinator.update_options({"tracked_flights": "lo 123 , ,W6 1706"})
+
+        assert coordinator.get_tracked_flights() == {"LO 123", "W6 1706"}
+
+    def test_empty_filters(self, coordinator):
+        """Test that missing filter strings disable filtering."""
+        coordinator.update_options({})
+
+        assert coordinator.airlines_filter == frozenset()
+        assert coordinator.destinations_filter == ()
+
+
+class TestUpdateData:
+    """Tests for _async_update_data method."""
+
+    async def test_concurrent_updates_share_fetch(self, coordinator):
+        """Test that overlapping updates share one in-flight fetch."""
+        release = asyncio.Event()
+
+        async def slow_fetch(*args, **kwargs):
+            await release.wait()
+            return {DIRECTION_ARRIVALS: [], DIRECTION_DEPARTURES: []}
+
+        with patch(
+            "custom_components.gdansk_airport.coordinator.fetch_all_flights",
+            side_effect=slow_fetch,
+        ) as mock_fetch:
+            first = asyncio.create_task(coordinator._async_update_data())
+            second = asyncio.create_task(coordinator._async_update_data())
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+            assert mock_fetch.call_count == 1
+            assert results[0] is results[1]
+
+            # A later update fetches again once the soft TTL has passed
+            coordinator._last_update_monotonic -= coordinator._soft_ttl
+            await coordinator._async_update_data()
+            assert mock_fetch.call_count == 2
+
+    async def test_shutdown_cancels_update_in_flight(self, coordinator):
+        """Test that shutting down cancels the shared update task."""
+        started = asyncio.Event()
+
+        async def hanging_fetch(*args, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+
+        with patch(
+            "custom_components.gdansk_airport.coordinator.fetch_all_flights",
+            side_effect=hanging_fetch,
+        ):
+            update = asyncio.create_task(coordinator._async_update_data())
+            await started.wait()
+
+            task = coordinator._update_task
+            coordinator.hass.async_create_background_task.assert_called_once()
+            await coordinator.async_shutdown()
+
+            with pytest.raises(asyncio.CancelledError):
+                await update
+            assert task.cancelled()
+
+    async def test_fresh_data_is_refiltered_without_fetch(
+        self, coordinator, fixed_now, monotonic
+    ):
+        """Test that refreshes within the soft TTL reuse the fetched boards."""
+        result = {
+            DIRECTION_ARRIVALS: [
+                make_flight("12:10", flight_number="LO 1", airline="LOT"),
+                make_flight("12:20", flight_number="FR 2", airline="Ryanair"),
+            ],
+            DIRECTION_DEPARTURES: [],
+        }
+
+        with patch(
+            "custom_components.gdansk_airport.coordinator.fetch_all_flights",
+            AsyncMock(return_value=result),
+        ) as mock_fetch:
+            data = await coordinator._async_update_data()
+            assert data["data_source"] == "live"
+            assert len(data[DIRECTION_ARRIVALS]) == 2
+
+            coordinator.airlines_filter = frozenset({"RYANAIR"})
+            monotonic.return_value += 60
+            data = await coordinator._async_update_data()
+
+            assert mock_fetch.call_count == 1
+            assert [f.flight_number for f in data[DIRECTION_ARRIVALS]] == ["FR 2"]
+            assert data["data_source"] == "cache"
+            assert data["cache_age_seconds"] == 60
+            assert data["last_updated"] == NOW.isoformat()
+
+    async def test_stale_data_is_fetched(self, coordinator, monotonic):
+        """Test that refreshes after the soft TTL fetch again."""
+        with patch(
+            "custom_components.gdansk_airport.coordinator.fetch_all_flights",
+            AsyncMock(return_value={DIRECTION_ARRIVALS: [], DIRECTION_DEPARTURES: []}),
+        ) as mock_fetch:
+            await coordinator._async_update_data()
+
+            monotonic.return_value += coordinator._soft_ttl
+            data = await coordinator._async_update_data()
+
+            assert mock_fetch.call_count == 2
+            assert data["data_source"] == "live"
+
+
+class TestBackOff:
+    """Tests for backing off when the website rate limits requests."""
+
+    async def test_rate_limit_backs_off_and_recovers(self, coordinator):
+        """Test that rate limiting lengthens the interval until a success."""
+        response = Mock()
+        response.status_code = 429
+        response.headers = {"Retry-After": "900"}
+        rate_limited = HTTPError("HTTP Error 429", 0, response)
+        coordinator.data = {"data_source": "live"}
+        coordinator._last_successful_update = NOW
+        coordinator._last_update_monotonic = time.monotonic()
+
+        with patch(
+            "custom_components.gdansk_airport.coordinator.fetch_all_flights",
+            AsyncMock(side_effect=rate_limited),
+        ):
+            data = await coordinator._async_update_data()
+
+        assert data["data_source"] == "cache"
+        assert coordinator.update_interval == timedelta(minutes=15)
+
+        with patch(
+            "custom_components.gdansk_airport.coordinator.fetch_all_flights",
+            AsyncMock(return_value={DIRECTION_ARRIVALS: [], DIRECTION_DEPARTURES: []}),
+        ):
+            data = await coordinator._async_update_data()
+
+        assert data["data_source"] == "live"
+        assert coordinator.update_interval == timedelta(minutes=5)
+
+    def test_back_off_doubles_interval(self, coordinator):
+        """Test that the interval doubles without a Retry-After header."""
+        coordinator._back_off(None)
+        assert coordinator.update_interval == timedelta(minutes=10)
+
+        coordinator._back_off(None)
+        assert coordinator.update_interval == timedelta(minutes=20)
+
+    def test_back_off_capped(self, coordinator):
+        """Test that backing off never exceeds the maximum interval."""
+        coordinator._back_off(7200)
+        assert coordinator.update_interval == timedelta(minutes=30)
+
+
+class TestHandleUpdateError:
+    """Tests for _handle_update_error method."""
+
+    def test_cache_age_ignores_wall_clock(self, coordinator, fixed_now, monotonic):
+        """Test that cache age comes from the monotonic clock."""
+        coordinator.data = {"data_source": "live", "cache_age_seconds": 0}
+        coordinator._last_successful_update = NOW
+        coordinator._last_update_monotonic = monotonic.return_value
+
+        # Wall clock jumps back an hour (e.g., DST) while 90 s really pass
+        fixed_now.now.return_value = NOW - timedelta(hours=1)
+        monotonic.return_value += 90
+
+        data = coordinator._handle_update_error("Timeout", TimeoutError())
+
+        assert data["data_source"] == "cache"
+        assert data["cache_age_seconds"] == 90
+
+    def test_too_old_cache_fails(self, coordinator, monotonic):
+        """Test that the update fails once the cache exceeds its max age."""
+        coordinator.data = {"data_source": "live"}
+        coordinator._last_update_monotonic = monotonic.return_value
+        monotonic.return_value += coordinator._max_cache_age.total_seconds()
+
+        with pytest.raises(UpdateFailed):
+            coordinator._handle_update_error("Timeout", TimeoutError())
@@ -0,0 +1,112 @@
+"""Tests for Gdańsk Airport integration setup and unload."""
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from custom_components.gdansk_airport import async_setup_entry, async_unload_entry
+from custom_components.gdansk_airport.const import (
+    CONF_DIRECTION,
+    DATA_SESSION,
+    DIRECTION_BOTH,
+    DOMAIN,
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = Mock()
+    hass.data = {}
+    hass.config_entries.async_forward_entry_setups = AsyncMock()
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    return hass
+
+
+def _mock_entry(entry_id: str) -> Mock:
+    """Create a mock config entry."""
+    entry = Mock()
+    entry.entry_id = entry_id
+    entry.data = {CONF_DIRECTION: DIRECTION_BOTH}
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def mock_setup():
+    """Patch the coordinator, session factory and services used by setup."""
+    with patch(
+        "custom_components.gdansk_airport.GdanskAirportCoordinator"
+    ) as mock_coordinator, patch(
+        "custom_components.gdansk_airport.create_session"
+    ) as mock_create, patch(
+        "custom_components.gdansk_airport.async_setup_services",
+        new_callable=AsyncMock,
+    ), patch(
+        "custom_components.gdansk_airport.async_unload_services",
+        new_callable=AsyncMock,
+    ):
+        mock_coordinator.return_value.async_config_entry_first_refresh = AsyncMock()
+        mock_coordinator.return_value.async_shutdown = AsyncMock()
+        mock_create.return_value = AsyncMock()
+        yield mock_coordinator, mock_create
+
+
+async def test_setup_creates_shared_session(mock_hass, mock_setup):
+    """Test that the first entry creates and stores the shared session."""
+    mock_coordinator, mock_create = mock_setup
+
+    assert await async_setup_entry(mock_hass, _mock_entry("entry_1"))
+
+    session = mock_create.return_value
+    assert mock_hass.data[DATA_SESSION] is session
+    assert mock_coordinator.call_args.kwargs["session"] is session
+
+
+async def test_setup_reuses_shared_session(mock_hass, mock_setup):
+    """Test that further entries reuse the shared session."""
+    mock_coordinator, mock_create = mock_setup
+
+    await async_setup_entry(mock_hass, _mock_entry("entry_1"))
+    await async_setup_entry(mock_hass, _mock_entry("entry_2"))
+
+    mock_create.assert_called_once()
+    sessions = [call.kwargs["session"] for call in mock_coordinator.call_args_list]
+    assert sessions[0] is sessions[1]
+
+
+async def test_unload_closes_session_after_last_entry(mock_hass, mock_setup):
+    """Test that the shared session is closed only when the last entry unloads."""
+    _, mock_create = mock_setup
+    session = mock_create.return_value
+    entry_1 = _mock_entry("entry_1")
+    entry_2 = _mock_entry("entry_2")
+
+    await async_setup_entry(mock_hass, entry_1)
+    await async_setup_entry(mock_hass, entry_2)
+
+    assert await async_unload_entry(mock_hass, entry_1)
+    session.close.assert_not_awaited()
+    assert mock_hass.data[DATA_SESSION] is session
+
+    assert await async_unload_entry(mock_hass, entry_2)
+    session.close.assert_awaited_once()
+    assert DATA_SESSION not in mock_hass.data
+    assert mock_hass.data[DOMAIN] == {}
+
+
+async def test_unload_shuts_down_coordinator_before_closing_session(
+    mock_hass, mock_setup
+):
+    """Test that the coordinator stops updating before the session closes."""
+    mock_coordinator, mock_create = mock_setup
+    session = mock_create.return_value
+    coordinator = mock_coordinator.return_value
+    manager = Mock()
+    manager.attach_mock(coordinator.async_shutdown, "shutdown")
+    manager.attach_mock(session.close, "close")
+    entry = _mock_entry("entry_1")
+
+    await async_setup_entry(mock_hass, entry)
+    assert await async_unload_entry(mock_hass, entry)
+
+    assert [c[0] for c in manager.mock_calls] == ["shutdown", "close"]
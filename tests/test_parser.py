@@ -1,7 +1,13 @@
 """Tests for Gdańsk Airport parser."""
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+import html
+import json
 from pathlib import Path
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 
+from curl_cffi.requests.exceptions import HTTPError, Timeout as CurlTimeout
 import pytest
 
 from custom_components.gdansk_airport.const import (
@@ -10,6 +16,7 @@ from custom_components.gdansk_airport.const import (
     FlightStatus,
 )
 from custom_components.gdansk_airport.parser import (
+    BoardCache,
     Flight,
     _calculate_delay,
     _extract_time_from_status,
@@ -17,11 +24,31 @@ from custom_components.gdansk_airport.parser import (
     _parse_html,
     fetch_all_flights,
     fetch_flights,
+    is_rate_limited,
+    retry_after_seconds,
 )
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+def make_http_error(status_code: int, headers: dict | None = None) -> HTTPError:
+    """Create an HTTP error carrying a response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return HTTPError(f"HTTP Error {status_code}", 0, response)
+
+
+def make_react_page(props: str, extra: str = "") -> str:
+    """Build a page embedding flight data as React component props."""
+    return (
+        "<html><body><nav><a href='/'>Home</a></nav>"
+        '<div data-controller="symfony--ux-react--react" '
+        f'data-symfony--ux-react--react-props-value="{html.escape(props)}">'
+        f"</div>{extra}</body></html>"
+    )
+
+
 @pytest.fixture
 def arrivals_html():
     """Load arrivals sample HTML."""
@@ -77,6 +104,11 @@ class TestCalculateDelay:
         result = _calculate_delay("invalid", "10:00")
         assert result is None
 
+    def test_out_of_range_time(self):
+        """Test with a time that is not a valid time of day."""
+        result = _calculate_delay("10:00", "25:10")
+        assert result is None
+
 
 class TestExtractTimeFromStatus:
     """Tests for _extract_time_from_status function."""
@@ -125,6 +157,61 @@ class TestParseHtml:
         assert all(f.destination is not None for f in flights)
         assert all(f.origin is None for f in flights)
 
+    def test_parse_json_props(self):
+        """Test parsing flights embedded as React props."""
+        arrivals = [
+            {
+                "origin": "PAFOS",
+                "remarks": "wylądował",
+                "dateTime": "2026-02-16T13:20:00+01:00",
+                "carrierName": "RYANAIR",
+                "expectedDateTime": "2026-02-16T14:09:00+01:00",
+                "flight": "FR 3554",
+                "remarksStatus": 2,
+            }
+        ]
+        page = make_react_page(json.dumps({"arrivals": json.dumps(arrivals)}))
+
+        flights = _parse_html(page, DIRECTION_ARRIVALS)
+
+        assert len(flights) == 1
+        assert flights[0].flight_number == "FR 3554"
+        assert flights[0].origin == "PAFOS"
+        assert flights[0].status == FlightStatus.LANDED
+        assert flights[0].delay_minutes == 49
+
+    def test_parse_json_props_null_carrier(self):
+        """Test that a flight without a carrier does not drop the board."""
+        arrivals = [
+            {
+                "origin": "PAFOS",
+                "dateTime": "2026-02-16T13:20:00+01:00",
+                "carrierName": None,
+                "flight": "FR 3554",
+            },
+            {
+                "origin": "WARSZAWA",
+                "dateTime": "2026-02-16T14:00:00+01:00",
+                "carrierName": "LOT",
+                "flight": "LO 123",
+            },
+        ]
+        page = make_react_page(json.dumps({"arrivals": json.dumps(arrivals)}))
+
+        flights = _parse_html(page, DIRECTION_ARRIVALS)
+
+        assert [f.flight_number for f in flights] == ["FR 3554", "LO 123"]
+        assert flights[0].airline == ""
+
+    def test_parse_invalid_json_props_falls_back(self, arrivals_html):
+        """Test that unusable React props fall back to HTML scraping."""
+        page = make_react_page("not json", extra=arrivals_html)
+
+        flights = _parse_html(page, DIRECTION_ARRIVALS)
+
+        assert flights == _parse_html(arrivals_html, DIRECTION_ARRIVALS)
+        assert len(flights) > 0
+
     def test_parse_empty_html(self):
         """Test parsing empty HTML."""
         flights = _parse_html("", DIRECTION_ARRIVALS)
@@ -203,6 +290,151 @@ class TestFlightToDict:
         assert result["delay_minutes"] == 30
         assert result["direction"] == DIRECTION_ARRIVALS
 
+    def test_derived_fields_not_serialized(self):
+        """Test that precomputed fields stay out of the dictionary."""
+        flight = Flight(
+            scheduled_time="10:00",
+            expected_time=None,
+            origin="Barcelona",
+            destination=None,
+            airline="WIZZ AIR",
+            flight_number="W6 1706",
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+
+        data = flight.to_dict()
+        assert "sched_min" not in data
+        assert "airline_upper" not in data
+        assert "flight_number_upper" not in data
+        assert "location_lower" not in data
+
+
+class TestFlightDerivedFields:
+    """Tests for fields precomputed on Flight."""
+
+    def test_sched_min(self):
+        """Test scheduled time converted to minutes of day."""
+        flight = Flight(
+            scheduled_time="22:50",
+            expected_time=None,
+            origin="Barcelona",
+            destination=None,
+            airline="WIZZ AIR",
+            flight_number="W6 1706",
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+
+        assert flight.sched_min == 22 * 60 + 50
+
+    def test_sched_min_invalid_time(self):
+        """Test invalid scheduled time gives no minutes value."""
+        flight = Flight(
+            scheduled_time="invalid",
+            expected_time=None,
+            origin="Barcelona",
+            destination=None,
+            airline="WIZZ AIR",
+            flight_number="W6 1706",
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+
+        assert flight.sched_min is None
+
+    def test_sched_min_out_of_range_time(self):
+        """Test out-of-range scheduled time gives no minutes value."""
+        flight = Flight(
+            scheduled_time="24:05",
+            expected_time=None,
+            origin="Barcelona",
+            destination=None,
+            airline="WIZZ AIR",
+            flight_number="W6 1706",
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+
+        assert flight.sched_min is None
+
+    def test_no_instance_dict(self):
+        """Test that flights use slots instead of a per-instance dict."""
+        flight = Flight(
+            scheduled_time="22:50",
+            expected_time=None,
+            origin="Barcelona",
+            destination=None,
+            airline="WIZZ AIR",
+            flight_number="W6 1706",
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+
+        assert not hasattr(flight, "__dict__")
+
+    def test_upper_case_fields(self):
+        """Test upper-cased airline and flight number used for matching."""
+        flight = Flight(
+            scheduled_time="22:50",
+            expected_time=None,
+            origin="Barcelona",
+            destination=None,
+            airline="Wizz Air",
+            flight_number="w6 1706",
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+
+        assert flight.airline_upper == "WIZZ AIR"
+        assert flight.flight_number_upper == "W6 1706"
+        assert flight.location_lower == "barcelona"
+
+
+class TestRateLimiting:
+    """Tests for rate limit detection and Retry-After parsing."""
+
+    def test_is_rate_limited(self):
+        """Test that only 429/503 responses count as rate limiting."""
+        assert is_rate_limited(make_http_error(429))
+        assert is_rate_limited(make_http_error(503))
+        assert not is_rate_limited(make_http_error(500))
+        assert not is_rate_limited(HTTPError("no response"))
+        assert not is_rate_limited(ValueError("other"))
+
+    def test_retry_after_seconds(self):
+        """Test Retry-After given in seconds."""
+        response = make_http_error(429, {"Retry-After": "120"}).response
+        assert retry_after_seconds(response) == 120
+
+    def test_retry_after_http_date(self):
+        """Test Retry-After given as an HTTP date."""
+        retry_at = datetime.now(UTC) + timedelta(minutes=10)
+        response = make_http_error(
+            503, {"Retry-After": format_datetime(retry_at, usegmt=True)}
+        ).response
+
+        assert 590 <= retry_after_seconds(response) <= 600
+
+    def test_retry_after_past_date(self):
+        """Test that a Retry-After date in the past means no wait."""
+        response = make_http_error(
+            503, {"Retry-After": "Mon, 16 Feb 2026 12:00:00 GMT"}
+        ).response
+        assert retry_after_seconds(response) == 0
+
+    def test_retry_after_missing_or_invalid(self):
+        """Test missing and unparsable Retry-After headers."""
+        assert retry_after_seconds(make_http_error(429).response) is None
+        response = make_http_error(429, {"Retry-After": "soon"}).response
+        assert retry_after_seconds(response) is None
+
 
 @pytest.mark.asyncio
 class TestFetchFlights:
@@ -236,6 +468,116 @@ class TestFetchFlights:
         assert len(flights) > 0
         assert all(isinstance(f, Flight) for f in flights)
 
+    async def test_fetch_passes_timeout(self, arrivals_html):
+        """Test that an explicit timeout is forwarded to the request."""
+        mock_response = Mock()
+        mock_response.text = arrivals_html
+        mock_response.raise_for_status = Mock()
+
+        mock_session = AsyncMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+
+        await fetch_flights(mock_session, DIRECTION_ARRIVALS, timeout=(10, 30))
+
+        assert mock_session.get.call_args.kwargs["timeout"] == (10, 30)
+
+    async def test_fetch_uses_session_timeout_by_default(self, arrivals_html):
+        """Test that no timeout is passed when none is given."""
+        mock_response = Mock()
+        mock_response.text = arrivals_html
+        mock_response.raise_for_status = Mock()
+
+        mock_session = AsyncMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+
+        await fetch_flights(mock_session, DIRECTION_ARRIVALS)
+
+        assert "timeout" not in mock_session.get.call_args.kwargs
+
+    async def test_fetch_parses_in_executor(self, arrivals_html):
+        """Test that HTML is parsed off the event loop thread."""
+        mock_response = Mock()
+        mock_response.text = arrivals_html
+        mock_response.raise_for_status = Mock()
+
+        mock_session = AsyncMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+        parse_threads = []
+
+        def record_thread(html_content, direction):
+            parse_threads.append(threading.current_thread())
+            return []
+
+        with patch(
+            "custom_components.gdansk_airport.parser._parse_html",
+            side_effect=record_thread,
+        ):
+            await fetch_flights(mock_session, DIRECTION_ARRIVALS)
+
+        assert parse_threads
+        assert parse_threads[0] is not threading.current_thread()
+
+    async def test_fetch_stores_validators(self, arrivals_html):
+        """Test that a full response updates the board cache."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = arrivals_html
+        mock_response.headers = {
+            "ETag": '"abc"',
+            "Last-Modified": "Mon, 16 Feb 2026 12:00:00 GMT",
+        }
+        mock_response.raise_for_status = Mock()
+
+        mock_session = AsyncMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+        cache = BoardCache()
+
+        flights = await fetch_flights(mock_session, DIRECTION_ARRIVALS, cache=cache)
+
+        headers = mock_session.get.call_args.kwargs["headers"]
+        assert "If-None-Match" not in headers
+        assert "If-Modified-Since" not in headers
+        assert cache.etag == '"abc"'
+        assert cache.last_modified == "Mon, 16 Feb 2026 12:00:00 GMT"
+        assert cache.flights is flights
+
+    async def test_fetch_not_modified_reuses_cache(self):
+        """Test that a 304 response returns the cached flights."""
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_response.raise_for_status = Mock()
+
+        mock_session = AsyncMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+        cached_flights = [Mock(spec=Flight)]
+        cache = BoardCache(
+            etag='"abc"',
+            last_modified="Mon, 16 Feb 2026 12:00:00 GMT",
+            flights=cached_flights,
+        )
+
+        flights = await fetch_flights(mock_session, DIRECTION_ARRIVALS, cache=cache)
+
+        headers = mock_session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+        assert headers["If-Modified-Since"] == "Mon, 16 Feb 2026 12:00:00 GMT"
+        assert flights is cached_flights
+
+    async def test_fetch_rate_limited_not_retried(self):
+        """Test that a rate-limited request is raised without retrying."""
+        error = make_http_error(429)
+        mock_response = Mock()
+        mock_response.raise_for_status = Mock(side_effect=error)
+
+        mock_session = AsyncMock()
+        mock_session.get = AsyncMock(return_value=mock_response)
+
+        with pytest.raises(HTTPError) as exc_info:
+            await fetch_flights(mock_session, DIRECTION_ARRIVALS)
+
+        assert exc_info.value is error
+        assert mock_session.get.call_count == 1
+
     async def test_fetch_http_error(self):
         """Test handling HTTP error."""
         mock_session = AsyncMock()
@@ -304,6 +646,23 @@ class TestFetchAllFlights:
             assert DIRECTION_DEPARTURES in result
             assert result[DIRECTION_DEPARTURES] == []
 
+    async def test_fetch_passes_caches(self):
+        """Test that each direction gets its own board cache."""
+        with patch(
+            "custom_components.gdansk_airport.parser.fetch_flights"
+        ) as mock_fetch:
+            mock_fetch.return_value = []
+            caches = {
+                DIRECTION_ARRIVALS: BoardCache(),
+                DIRECTION_DEPARTURES: BoardCache(),
+            }
+
+            await fetch_all_flights(AsyncMock(), caches=caches)
+
+            arrivals_call, departures_call = mock_fetch.call_args_list
+            assert arrivals_call.kwargs["cache"] is caches[DIRECTION_ARRIVALS]
+            assert departures_call.kwargs["cache"] is caches[DIRECTION_DEPARTURES]
+
     async def test_fetch_with_error(self):
         """Test handling error in one direction."""
         with patch(
@@ -320,3 +679,51 @@ class TestFetchAllFlights:
             # Should return empty list for failed direction
             assert result[DIRECTION_ARRIVALS] == []
             assert result[DIRECTION_DEPARTURES] == []
+
+    async def test_fetch_rate_limited_raises(self):
+        """Test that rate limiting on either board is raised to the caller."""
+        with patch(
+            "custom_components.gdansk_airport.parser.fetch_flights"
+        ) as mock_fetch:
+            error = make_http_error(429)
+            mock_fetch.side_effect = [[], error]
+
+            with pytest.raises(HTTPError) as exc_info:
+                await fetch_all_flights(AsyncMock())
+
+            assert exc_info.value is error
+
+    async def test_fetch_with_error_reuses_cache(self):
+        """Test that a failed direction falls back to its cached flights."""
+        with patch(
+            "custom_components.gdansk_airport.parser.fetch_flights"
+        ) as mock_fetch:
+            departures = [Mock(spec=Flight)]
+            mock_fetch.side_effect = [Exception("Error"), departures]
+            cached_arrivals = [Mock(spec=Flight)]
+            caches = {
+                DIRECTION_ARRIVALS: BoardCache(flights=cached_arrivals),
+                DIRECTION_DEPARTURES: BoardCache(),
+            }
+
+            result = await fetch_all_flights(AsyncMock(), caches=caches)
+
+            assert result[DIRECTION_ARRIVALS] is cached_arrivals
+            assert result[DIRECTION_DEPARTURES] is departures
+
+    async def test_fetch_all_failed_raises(self):
+        """Test that cached flights are not reused when every direction fails."""
+        with patch(
+            "custom_components.gdansk_airport.parser.fetch_flights"
+        ) as mock_fetch:
+            error = CurlTimeout("Timed out")
+            mock_fetch.side_effect = [error, CurlTimeout("Timed out")]
+            caches = {
+                DIRECTION_ARRIVALS: BoardCache(flights=[Mock(spec=Flight)]),
+                DIRECTION_DEPARTURES: BoardCache(flights=[Mock(spec=Flight)]),
+            }
+
+            with pytest.raises(CurlTimeout) as exc_info:
+                await fetch_all_flights(AsyncMock(), caches=caches)
+
+            assert exc_info.value is error
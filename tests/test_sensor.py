@@ -0,0 +1,82 @@
+"""Tests for Gdańsk Airport sensors."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.gdansk_airport.const import (
+    DIRECTION_ARRIVALS,
+    SENSOR_ARRIVALS,
+    FlightStatus,
+)
+from custom_components.gdansk_airport.parser import Flight
+from custom_components.gdansk_airport.sensor import SENSOR_TYPES, GdanskAirportSensor
+
+
+def make_data(*flight_numbers: str) -> dict:
+    """Create coordinator data with the given arrivals."""
+    flights = [
+        Flight(
+            scheduled_time="12:00",
+            expected_time=None,
+            origin="Warsaw",
+            destination=None,
+            airline="LOT",
+            flight_number=flight_number,
+            status=FlightStatus.EXPECTED,
+            delay_minutes=None,
+            direction=DIRECTION_ARRIVALS,
+        )
+        for flight_number in flight_numbers
+    ]
+    return {
+        DIRECTION_ARRIVALS: flights,
+        "next_arrival": flights[0] if flights else None,
+        "last_updated": "2026-02-16T12:00:00",
+        "data_source": "live",
+        "cache_age_seconds": 0,
+    }
+
+
+@pytest.fixture
+def arrivals_sensor():
+    """Create an arrivals sensor with a mock coordinator."""
+    coordinator = Mock()
+    coordinator.data = make_data("LO 1")
+    entry = Mock()
+    entry.entry_id = "entry"
+    entry.data = {}
+    description = next(d for d in SENSOR_TYPES if d.key == SENSOR_ARRIVALS)
+    return GdanskAirportSensor(coordinator, description, entry)
+
+
+class TestExtraStateAttributes:
+    """Tests for sensor state attributes."""
+
+    def test_attributes(self, arrivals_sensor):
+        """Test attributes built from coordinator data."""
+        attributes = arrivals_sensor.extra_state_attributes
+
+        assert [f["flight_number"] for f in attributes["flights"]] == ["LO 1"]
+        assert attributes["next_flight"]["flight_number"] == "LO 1"
+        assert attributes["data_source"] == "live"
+
+    def test_attributes_cached_until_new_data(self, arrivals_sensor):
+        """Test that attributes are rebuilt only when coordinator data changes."""
+        with patch.object(
+            Flight, "to_dict", autospec=True, side_effect=Flight.to_dict
+        ) as mock_to_dict:
+            first = arrivals_sensor.extra_state_attributes
+            assert arrivals_sensor.extra_state_attributes is first
+            assert mock_to_dict.call_count == 2  # flights list and next flight
+
+            arrivals_sensor.coordinator.data = make_data("LO 2")
+            second = arrivals_sensor.extra_state_attributes
+
+        assert second is not first
+        assert [f["flight_number"] for f in second["flights"]] == ["LO 2"]
+
+    def test_no_data(self, arrivals_sensor):
+        """Test that missing coordinator data gives no attributes."""
+        arrivals_sensor.coordinator.data = None
+
+        assert arrivals_sensor.extra_state_attributes == {}
@@ -0,0 +1,153 @@
+"""Tests for Gdańsk Airport services."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import voluptuous as vol
+
+from custom_components.gdansk_airport.const import (
+    CONF_TRACKED_FLIGHTS,
+    DIRECTION_BOTH,
+    DOMAIN,
+)
+from custom_components.gdansk_airport.coordinator import GdanskAirportCoordinator
+from custom_components.gdansk_airport.services import (
+    SERVICE_TRACK_FLIGHT,
+    SERVICE_UNTRACK_FLIGHT,
+    TRACK_FLIGHT_SCHEMA,
+    UNTRACK_FLIGHT_SCHEMA,
+    async_setup_services,
+    normalize_flight_number,
+    validate_flight_number,
+)
+
+
+@pytest.fixture
+def entry():
+    """Create a mock config entry tracking one flight."""
+    entry = Mock()
+    entry.entry_id = "entry"
+    entry.options = {CONF_TRACKED_FLIGHTS: "lo 123"}
+    return entry
+
+
+@pytest.fixture
+async def hass(entry):
+    """Create a mock Home Assistant instance with services registered."""
+    hass = Mock()
+    coordinator = GdanskAirportCoordinator(
+        hass,
+        direction=DIRECTION_BOTH,
+        scan_interval=timedelta(minutes=5),
+        session=AsyncMock(),
+    )
+    coordinator.update_options(entry.options)
+    hass.data = {DOMAIN: {entry.entry_id: {"coordinator": coordinator}}}
+    hass.config_entries.async_entries.return_value = [entry]
+
+    await async_setup_services(hass)
+    return hass
+
+
+def get_handler(hass: Mock, service: str):
+    """Get a registered service handler that validates its call data."""
+    for call in hass.services.async_register.call_args_list:
+        if call.args[1] == service:
+            handler = call.args[2]
+            schema = call.kwargs["schema"]
+            return lambda data: handler(Mock(data=schema(data)))
+    raise AssertionError(f"{service} not registered")
+
+
+class TestNormalizeFlightNumber:
+    """Tests for flight number validation."""
+
+    @pytest.mark.parametrize(
+        ("flight_number", "expected"),
+        [
+            ("W6 1706", "W6 1706"),
+            (" lo 123 ", "LO 123"),
+            ("fr1234", "FR1234"),
+            ("3s 101a", "3S 101A"),
+        ],
+    )
+    def test_valid(self, flight_number, expected):
+        """Test valid flight numbers are upper-cased and stripped."""
+        assert normalize_flight_number(flight_number) == expected
+        assert validate_flight_number(flight_number)
+
+    @pytest.mark.parametrize(
+        "flight_number", ["", "L 123", "LO", "LO 12345", "LO 123AB", "LO-123"]
+    )
+    def test_invalid(self, flight_number):
+        """Test invalid flight numbers are rejected."""
+        assert normalize_flight_number(flight_number) is None
+        assert not validate_flight_number(flight_number)
+
+
+class TestServiceSchemas:
+    """Tests for service call validation."""
+
+    @pytest.mark.parametrize("schema", [TRACK_FLIGHT_SCHEMA, UNTRACK_FLIGHT_SCHEMA])
+    def test_flight_number_normalized(self, schema):
+        """Test that the schema normalizes a valid flight number."""
+        assert schema({"flight_number": " w6 1706 "}) == {"flight_number": "W6 1706"}
+
+    @pytest.mark.parametrize("schema", [TRACK_FLIGHT_SCHEMA, UNTRACK_FLIGHT_SCHEMA])
+    def test_invalid_flight_number(self, schema):
+        """Test that the schema rejects an invalid flight number."""
+        with pytest.raises(vol.Invalid):
+            schema({"flight_number": "LO-123"})
+
+
+class TestTrackFlight:
+    """Tests for the track_flight service."""
+
+    async def test_track_new_flight(self, hass, entry):
+        """Test that a new flight is added to the entry options."""
+        handler = get_handler(hass, SERVICE_TRACK_FLIGHT)
+
+        await handler({"flight_number": "w6 1706"})
+
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            entry, options={CONF_TRACKED_FLIGHTS: "LO 123, W6 1706"}
+        )
+
+    async def test_track_invalid_flight(self, hass):
+        """Test that an invalid flight number is rejected by the schema."""
+        handler = get_handler(hass, SERVICE_TRACK_FLIGHT)
+
+        with pytest.raises(vol.Invalid):
+            await handler({"flight_number": "not a flight"})
+
+        hass.config_entries.async_update_entry.assert_not_called()
+
+    async def test_track_already_tracked_flight(self, hass):
+        """Test that tracking a tracked flight leaves the options alone."""
+        handler = get_handler(hass, SERVICE_TRACK_FLIGHT)
+
+        await handler({"flight_number": "LO 123"})
+
+        hass.config_entries.async_update_entry.assert_not_called()
+
+
+class TestUntrackFlight:
+    """Tests for the untrack_flight service."""
+
+    async def test_untrack_flight(self, hass, entry):
+        """Test that a tracked flight is removed from the entry options."""
+        handler = get_handler(hass, SERVICE_UNTRACK_FLIGHT)
+
+        await handler({"flight_number": "LO 123"})
+
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            entry, options={CONF_TRACKED_FLIGHTS: ""}
+        )
+
+    async def test_untrack_unknown_flight(self, hass):
+        """Test that untracking an untracked flight leaves the options alone."""
+        handler = get_handler(hass, SERVICE_UNTRACK_FLIGHT)
+
+        await handler({"flight_number": "FR 1"})
+
+        hass.config_entries.async_update_entry.assert_not_called()
@@ -34,7 +34,7 @@ def sample_flight():
 def test_get_flight_key(tracker, sample_flight):
     """Test flight key generation."""
     key = tracker.get_flight_key(sample_flight)
-    assert key == "LO 123_10:00_arrivals"
+    assert key == ("LO 123", "10:00", "arrivals")
 
 
 def test_get_flight_key_unique_for_different_times(tracker):
@@ -66,8 +66,8 @@ def test_get_flight_key_unique_for_different_times(tracker):
     key2 = tracker.get_flight_key(flight2)
 
     assert key1 != key2
-    assert key1 == "LO 123_10:00_arrivals"
-    assert key2 == "LO 123_14:00_arrivals"
+    assert key1 == ("LO 123", "10:00", "arrivals")
+    assert key2 == ("LO 123", "14:00", "arrivals")
 
 
 def test_detect_changes_no_previous_state(tracker, sample_flight):
@@ -392,3 +392,54 @@ def test_detect_changes_departure_flight(tracker):
     change = changes[0]
     assert change.old_status == FlightStatus.CHECK_IN
     assert change.new_status == FlightStatus.BOARDING
+
+
+def test_detect_changes_accepts_iterator(tracker, sample_flight):
+    """Test that flights can be passed as a one-shot iterator."""
+    tracker.detect_changes(iter([sample_flight]))
+
+    landed = Flight(
+        scheduled_time="10:00",
+        expected_time=None,
+        origin="Warsaw",
+        destination=None,
+        airline="LOT",
+        flight_number="LO 123",
+        status=FlightStatus.LANDED,
+        delay_minutes=None,
+        direction="arrivals",
+    )
+
+    changes = tracker.detect_changes(iter([landed]))
+    assert len(changes) == 1
+    assert changes[0].new_status == FlightStatus.LANDED
+
+
+def test_state_change_has_no_instance_dict(sample_flight):
+    """Test that state changes use slots instead of a per-instance dict."""
+    change = FlightStateChange(
+        flight=sample_flight,
+        old_status=FlightStatus.EXPECTED,
+        new_status=FlightStatus.LANDED,
+    )
+
+    assert not hasattr(change, "__dict__")
+
+
+@pytest.mark.parametrize(
+    ("old_delay", "new_delay", "expected"),
+    [(None, None, False), (10, 10, False), (None, 10, True), (10, 25, True)],
+)
+def test_state_change_derives_delay_changed(
+    sample_flight, old_delay, new_delay, expected
+):
+    """Test that delay_changed is derived from the old and new delays."""
+    change = FlightStateChange(
+        flight=sample_flight,
+        old_status=FlightStatus.EXPECTED,
+        new_status=FlightStatus.DELAYED,
+        old_delay=old_delay,
+        new_delay=new_delay,
+    )
+
+    assert change.delay_changed is expected